@@ -43,11 +43,87 @@ def create_app() -> Flask:
     app.config["SQLALCHEMY_DATABASE_URI"] = database_url
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    # Recurrence detection: more than one worker lets very large imports shard detection
+    # across a process pool; imports smaller than two shards always run in-process.
+    app.config["DETECTION_WORKERS"] = int(os.getenv("DETECTION_WORKERS", "1"))
+    app.config["DETECTION_MIN_SHARD_SIZE"] = int(os.getenv("DETECTION_MIN_SHARD_SIZE", "5000"))
+
+    # Background imports: uploads above the threshold are spooled to disk and processed by a job
+    # worker. IMPORT_WORKER_MODE="thread" runs jobs in this process; "external" leaves them for worker.py.
+    app.config["IMPORT_ASYNC_THRESHOLD_BYTES"] = int(os.getenv("IMPORT_ASYNC_THRESHOLD_BYTES", str(5 * 1024 * 1024)))
+    app.config["IMPORT_WORKER_MODE"] = os.getenv("IMPORT_WORKER_MODE", "thread")
+    app.config["IMPORT_WORKERS"] = int(os.getenv("IMPORT_WORKERS", "2"))
+    app.config["IMPORT_QUEUE_PATH"] = os.getenv(
+        "IMPORT_QUEUE_PATH",
+        os.path.join(app.instance_path, "import_jobs.db")
+    )
+    app.config["IMPORT_SPOOL_DIR"] = os.getenv(
+        "IMPORT_SPOOL_DIR",
+        os.path.join(app.instance_path, "import_spool")
+    )
+
+    # A running job with no progress heartbeat for this long is failed as orphaned (dead worker);
+    # the sweep that checks runs this often.
+    app.config["IMPORT_STALE_JOB_SECONDS"] = float(os.getenv("IMPORT_STALE_JOB_SECONDS", "900"))
+    app.config["IMPORT_SWEEP_SECONDS"] = float(os.getenv("IMPORT_SWEEP_SECONDS", "60"))
+
+    # Password hashing: bcrypt work factor, and a small dedicated pool so a burst of logins can't
+    # take every CPU. Requests beyond workers + queue depth get 503; BCRYPT_WORKERS=0 hashes inline.
+    app.config["BCRYPT_ROUNDS"] = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    app.config["BCRYPT_WORKERS"] = int(os.getenv("BCRYPT_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+    app.config["BCRYPT_QUEUE_DEPTH"] = int(os.getenv("BCRYPT_QUEUE_DEPTH", "32"))
+
+    # Login negative cache: a Bloom filter of registered emails sized for this many accounts at this
+    # false-positive rate (~1.8 MB at the defaults). Lookups that miss re-read new users at most this often.
+    app.config["EMAIL_FILTER_CAPACITY"] = int(os.getenv("EMAIL_FILTER_CAPACITY", "1000000"))
+    app.config["EMAIL_FILTER_ERROR_RATE"] = float(os.getenv("EMAIL_FILTER_ERROR_RATE", "0.001"))
+    app.config["EMAIL_FILTER_REFRESH_SECONDS"] = float(os.getenv("EMAIL_FILTER_REFRESH_SECONDS", "1.0"))
+
+    # JWT user lookups are cached per process; the TTL defaults to the access token lifetime.
+    app.config["USER_CACHE_SIZE"] = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    app.config["USER_CACHE_TTL_SECONDS"] = float(os.getenv(
+        "USER_CACHE_TTL_SECONDS",
+        str(app.config["JWT_ACCESS_TOKEN_EXPIRES"].total_seconds())
+    ))
+
+    # Rate limits ("<count>/<second|minute|hour|day>") on the expensive endpoints: imports per user id;
+    # logins per client IP + email, plus RATE_LIMIT_LOGIN_IP per client IP across all emails (the client
+    # IP is request.remote_addr, so behind a reverse proxy wrap the app in ProxyFix). The "sqlite"
+    # backend shares buckets between all workers on the host.
+    # MAX_CONCURRENT_IMPORTS caps each user's in-flight imports (background jobs included); 0 disables it.
+    # The cap doesn't depend on RATE_LIMIT_ENABLED, but its leases live in the RATE_LIMIT_BACKEND store.
+    app.config["RATE_LIMIT_ENABLED"] = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+    app.config["RATE_LIMIT_BACKEND"] = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    app.config["RATE_LIMIT_SQLITE_PATH"] = os.getenv(
+        "RATE_LIMIT_SQLITE_PATH",
+        os.path.join(app.instance_path, "rate_limits.db")
+    )
+    app.config["RATE_LIMIT_LOGIN"] = os.getenv("RATE_LIMIT_LOGIN", "10/minute")
+    app.config["RATE_LIMIT_LOGIN_IP"] = os.getenv("RATE_LIMIT_LOGIN_IP", "30/minute")
+    app.config["RATE_LIMIT_IMPORTS"] = os.getenv("RATE_LIMIT_IMPORTS", "30/hour")
+    app.config["MAX_CONCURRENT_IMPORTS"] = int(os.getenv("MAX_CONCURRENT_IMPORTS", "2"))
+    app.config["IMPORT_SLOT_TTL_SECONDS"] = float(os.getenv("IMPORT_SLOT_TTL_SECONDS", "3600"))
+
+    # Opt-in request profiling: Server-Timing headers plus Prometheus metrics at /api/_metrics.
+    # The metrics endpoint only exists when METRICS_TOKEN is set, and scrapers must send it as
+    # "Authorization: Bearer <token>". Memory tracing (tracemalloc) is a separate switch because
+    # it slows every allocation.
+    app.config["PROFILING_ENABLED"] = os.getenv("PROFILING_ENABLED", "0") == "1"
+    app.config["METRICS_TOKEN"] = os.getenv("METRICS_TOKEN", "")
+    app.config["PROFILING_TRACE_MEMORY"] = os.getenv("PROFILING_TRACE_MEMORY", "0") == "1"
+
+    # JSON encoding: orjson when installed ("auto"), or force the stdlib encoder with "stdlib"
+    app.config["JSON_BACKEND"] = os.getenv("JSON_BACKEND", "auto")
+
+    from .utils.json_provider import init_json_provider
+    init_json_provider(app)
+
     # CORS configuration to allow the frontend to call the API
     cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
     CORS(
         app,
         resources={r"/api/*": {"origins": cors_origins}},
+        expose_headers=["X-Next-Cursor"],  # List pagination cursor
         supports_credentials=False
     )
 
@@ -56,18 +132,41 @@ def create_app() -> Flask:
     migrate.init_app(app, db)
     jwt.init_app(app)
 
+    from .utils.recurrence import init_detection_pool
+    init_detection_pool(app)
+
+    from .utils.jobs import init_import_jobs
+    init_import_jobs(app)
+
+    from .utils.passwords import init_password_hasher
+    init_password_hasher(app)
+
+    from .utils.email_filter import init_known_emails
+    init_known_emails(app)
+
+    from .utils.rate_limit import init_rate_limiter
+    init_rate_limiter(app)
+
+    from .utils.profiling import init_profiling
+    init_profiling(app, db)
+
+    from .utils.user_cache import init_user_cache
+    init_user_cache(app, jwt)
+
     # Register API route blueprints
     from .routes.auth import bp as auth_bp
     from .routes.subscriptions import bp as subs_bp
     from .routes.candidates import bp as cand_bp
     from .routes.imports import bp as imports_bp
     from .routes.dashboard import bp as dash_bp
+    from .routes.transactions import bp as txn_bp
 
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(subs_bp, url_prefix="/api/subscriptions")
     app.register_blueprint(cand_bp, url_prefix="/api/candidates")
     app.register_blueprint(imports_bp, url_prefix="/api/imports")
     app.register_blueprint(dash_bp, url_prefix="/api/dashboard")
+    app.register_blueprint(txn_bp, url_prefix="/api/transactions")
 
     # Simple health check endpoint
     @app.get("/api/health")
@@ -98,6 +98,30 @@ class RecurringCandidate(db.Model):
         back_populates="candidates"
     )
 
+    # Composite indexes matching the review queue (ordered by confidence) and import lookups
+    __table_args__ = (
+        db.Index("ix_recurring_candidates_user_confidence", "user_id", "confidence"),
+        db.Index("ix_recurring_candidates_user_status_confidence", "user_id", "status", "confidence"),
+        db.Index("ix_recurring_candidates_user_merchant_status", "user_id", "merchant_key", "status"),
+    )
+
+    # The columns to_dict() returns; list endpoints select exactly these and serialize the rows directly
+    JSON_FIELDS = (
+        "id",
+        "user_id",
+        "merchant_key",
+        "display_name",
+        "avg_amount",
+        "cadence_guess",
+        "confidence",
+        "last_seen",
+        "next_predicted",
+        "status",
+        "confirmed_subscription_id",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self):
         """Convert model instance to a JSON-serializable dictionary."""
         return {
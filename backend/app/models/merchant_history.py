@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import datetime
+from .. import db
+
+
+class MerchantHistory(db.Model):
+    """Rolling per-merchant charge state so detection can span multiple imports."""
+
+    __tablename__ = "merchant_histories"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Foreign key linking this history to a user
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id"),
+        nullable=False,
+        index=True
+    )
+
+    # Normalized merchant identifier (one history row per user + merchant)
+    merchant_key = db.Column(
+        db.String(160),
+        nullable=False
+    )
+
+    # Total number of distinct charges ever folded into this history
+    charge_count = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    # First and most recent charge dates seen across all imports
+    first_seen = db.Column(
+        db.Date,
+        nullable=False
+    )
+
+    last_seen = db.Column(
+        db.Date,
+        nullable=False
+    )
+
+    # Most recent charges kept for detection: sorted date ordinals and aligned amounts in cents
+    recent_dates = db.Column(
+        db.JSON,
+        nullable=False,
+        default=list
+    )
+
+    recent_amounts = db.Column(
+        db.JSON,
+        nullable=False,
+        default=list
+    )
+
+    # Summary statistics over the recent window (informational; detection recomputes them)
+    median_gap = db.Column(
+        db.Float,
+        nullable=True
+    )
+
+    median_amount_cents = db.Column(
+        db.Integer,
+        nullable=True
+    )
+
+    # Timestamp tracking
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    # Relationship back to the owning user
+    user = db.relationship(
+        "User",
+        back_populates="merchant_histories"
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "user_id",
+            "merchant_key",
+            name="uq_merchant_histories_user_merchant"
+        ),
+    )
+
+    def to_dict(self):
+        """Convert model instance to a JSON-serializable dictionary."""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "merchant_key": self.merchant_key,
+            "charge_count": self.charge_count,
+            "first_seen": self.first_seen.isoformat(),
+            "last_seen": self.last_seen.isoformat(),
+            "median_gap": self.median_gap,
+            "median_amount": (
+                self.median_amount_cents / 100
+                if self.median_amount_cents is not None else None
+            ),
+            "updated_at": self.updated_at.isoformat(),
+        }
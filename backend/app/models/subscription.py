@@ -96,6 +96,30 @@ class Subscription(db.Model):
         back_populates="subscriptions"
     )
 
+    # Composite indexes matching the per-user list, dashboard "upcoming" and top-N queries
+    __table_args__ = (
+        db.Index("ix_subscriptions_user_created", "user_id", "created_at"),
+        db.Index("ix_subscriptions_user_status_created", "user_id", "status", "created_at"),
+        db.Index("ix_subscriptions_user_status_due", "user_id", "status", "next_due_date"),
+        db.Index("ix_subscriptions_user_status_amount", "user_id", "status", "amount"),
+    )
+
+    # The columns to_dict() returns; list endpoints select exactly these and serialize the rows directly
+    JSON_FIELDS = (
+        "id",
+        "user_id",
+        "name",
+        "merchant_key",
+        "amount",
+        "cadence",
+        "next_due_date",
+        "category",
+        "status",
+        "notes",
+        "created_at",
+        "updated_at",
+    )
+
     def to_dict(self):
         """Convert model instance to a JSON-serializable dictionary."""
         return {
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import datetime
+from .. import db
+
+
+class UserSummary(db.Model):
+    """Per-user dashboard totals, kept up to date by the subscription write handlers."""
+
+    __tablename__ = "user_summaries"
+
+    # One summary row per user
+    user_id = db.Column(
+        db.Integer,
+        db.ForeignKey("users.id"),
+        primary_key=True
+    )
+
+    # Monthly-equivalent spend across active subscriptions, in integer cents (exact, so the
+    # per-write deltas can't drift the way a float running total does)
+    monthly_total_cents = db.Column(
+        db.BigInteger,
+        nullable=False,
+        default=0
+    )
+
+    # Annual-equivalent spend across active subscriptions, in integer cents
+    annual_total_cents = db.Column(
+        db.BigInteger,
+        nullable=False,
+        default=0
+    )
+
+    # Number of active subscriptions
+    active_count = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    # Highest nominal charges: [{"id", "name", "amount", "cadence"}, ...] (at most 5)
+    top_subscriptions = db.Column(
+        db.JSON,
+        nullable=False,
+        default=list
+    )
+
+    # Timestamp tracking
+    updated_at = db.Column(
+        db.DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    # Relationship back to the owning user
+    user = db.relationship(
+        "User",
+        back_populates="summary"
+    )
+
+    def to_dict(self):
+        """Convert model instance to a JSON-serializable dictionary."""
+        return {
+            "user_id": self.user_id,
+            "monthly_total": self.monthly_total_cents / 100,
+            "annual_total": self.annual_total_cents / 100,
+            "active_count": self.active_count,
+            "top_subscriptions": self.top_subscriptions,
+            "updated_at": self.updated_at.isoformat(),
+        }
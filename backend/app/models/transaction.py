@@ -98,9 +98,21 @@ class Transaction(db.Model):
         index=True
     )
 
-    # Transaction amount
-    amount = db.Column(
-        db.Numeric(10, 2),
+    # Transaction amount in integer cents (exact; the API still reports dollars)
+    amount_cents = db.Column(
+        db.BigInteger,
+        nullable=False
+    )
+
+    # Dollar amount derived in SQL, so ?fields=amount projections keep working (not loaded by default)
+    amount = db.column_property(
+        db.cast(amount_cents, db.Float) / 100,
+        deferred=True
+    )
+
+    # Content hash of (user, date, amount, merchant, occurrence) used to skip re-imported rows
+    fingerprint = db.Column(
+        db.String(32),
         nullable=False
     )
 
@@ -123,6 +135,25 @@ class Transaction(db.Model):
         back_populates="transactions"
     )
 
+    # Composite indexes for transaction history: date-ordered pages and merchant lookups
+    __table_args__ = (
+        db.Index("ix_transactions_user_date_id", "user_id", "txn_date", "id"),
+        db.Index("ix_transactions_user_merchant_date", "user_id", "merchant_key", "txn_date"),
+        db.UniqueConstraint("user_id", "fingerprint", name="uq_transactions_user_fingerprint"),
+    )
+
+    # The columns to_dict() returns; list endpoints select exactly these and serialize the rows directly
+    JSON_FIELDS = (
+        "id",
+        "user_id",
+        "import_id",
+        "txn_date",
+        "merchant_raw",
+        "merchant_key",
+        "amount",
+        "created_at",
+    )
+
     def to_dict(self):
         """Convert model instance to a JSON-serializable dictionary."""
         return {
@@ -132,6 +163,6 @@ class Transaction(db.Model):
             "txn_date": self.txn_date.isoformat(),
             "merchant_raw": self.merchant_raw,
             "merchant_key": self.merchant_key,
-            "amount": float(self.amount),
+            "amount": self.amount_cents / 100,
             "created_at": self.created_at.isoformat(),
         }
@@ -5,9 +5,9 @@
 # Date: February 5th 2026
 # Version: 0.1.0
 
-import bcrypt
 from datetime import datetime
 from .. import db
+from ..utils.passwords import get_password_hasher
 
 
 class User(db.Model):
@@ -61,26 +61,35 @@ class User(db.Model):
         cascade="all, delete-orphan"
     )
 
+    merchant_histories = db.relationship(
+        "MerchantHistory",
+        back_populates="user",
+        cascade="all, delete-orphan"
+    )
+
+    summary = db.relationship(
+        "UserSummary",
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
+
     def set_password(self, raw_password: str) -> None:
-        """Hash and store a new password."""
+        """
+        Hash and store a new password (on the app's bcrypt pool).
+        Raises PasswordHasherBusy when the pool is saturated.
+        """
         if not raw_password or len(raw_password) < 8:
             raise ValueError("Password must be at least 8 characters long.")
 
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(
-            raw_password.encode("utf-8"),
-            salt
-        )
+        self.password_hash = get_password_hasher().hash(raw_password)
 
     def check_password(self, raw_password: str) -> bool:
-        """Verify a password against the stored hash."""
+        """
+        Verify a password against the stored hash (on the app's bcrypt pool).
+        Raises PasswordHasherBusy when the pool is saturated.
+        """
         if not raw_password:
             return False
 
-        try:
-            return bcrypt.checkpw(
-                raw_password.encode("utf-8"),
-                self.password_hash
-            )
-        except Exception:
-            return False
+        return get_password_hasher().verify(raw_password, self.password_hash)
@@ -9,17 +9,41 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
+    current_user,
     jwt_required,
     get_jwt_identity,
 )
 
 from .. import db
+from ..models.summary import UserSummary
 from ..models.user import User
+from ..utils.email_filter import get_known_emails
+from ..utils.passwords import PasswordHasherBusy, get_password_hasher
+from ..utils.rate_limit import rate_limited
 
 
 bp = Blueprint("auth", __name__)
 
 
+def _client_ip() -> str:
+    """Rate-limit key for one source of logins, whichever accounts it tries."""
+    return request.remote_addr or ""
+
+
+def _login_key() -> str:
+    """
+    Rate-limit key for login attempts on one account from one source. Keying on the email
+    alone would let anyone lock a user out by failing their logins from elsewhere.
+    """
+    email = ((request.get_json(silent=True) or {}).get("email") or "").strip().lower()
+    return f"{_client_ip()}|{email}"
+
+
+def _hasher_busy():
+    """503 for a saturated bcrypt pool; clients should back off briefly and retry."""
+    return jsonify({"error": "Too many sign-ins in progress. Please retry shortly."}), 503, {"Retry-After": "1"}
+
+
 @bp.post("/register")
 def register():
     """Create a new user account and return access + refresh tokens."""
@@ -34,16 +58,26 @@ def register():
     if User.query.filter_by(email=email).first():
         return jsonify({"error": "Email already registered."}), 409
 
+    # Hand the DB connection back while bcrypt runs (see login).
+    db.session.close()
+
     user = User(email=email)
 
     try:
         user.set_password(password)
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
+    except PasswordHasherBusy:
+        return _hasher_busy()
+
+    # The dashboard summary starts out empty and is kept up to date by subscription writes.
+    user.summary = UserSummary()
 
     db.session.add(user)
     db.session.commit()
 
+    get_known_emails().add(email)
+
     access_token = create_access_token(identity=str(user.id))
     refresh_token = create_refresh_token(identity=str(user.id))
 
@@ -58,6 +92,8 @@ def register():
 
 
 @bp.post("/login")
+@rate_limited("login-ip", _client_ip)
+@rate_limited("login", _login_key)
 def login():
     """Authenticate an existing user and return access + refresh tokens."""
     data = request.get_json(silent=True) or {}
@@ -65,11 +101,31 @@ def login():
     email = (data.get("email") or "").strip().lower()
     password = data.get("password") or ""
 
-    user = User.query.filter_by(email=email).first()
-
-    if not user or not user.check_password(password):
+    # Rejected before the account lookup, so known and unknown emails do the same (no) work.
+    if not password:
         return jsonify({"error": "Invalid credentials."}), 401
 
+    # Emails that were never registered are answered from memory without a DB lookup.
+    user = None
+    if get_known_emails().might_exist(email):
+        user = User.query.filter_by(email=email).first()
+
+    # Hand the DB connection back before the (possibly queued) bcrypt check; otherwise a burst of
+    # waiting logins holds every pooled connection and unrelated requests stall behind them.
+    # The loaded user stays usable detached.
+    db.session.close()
+
+    try:
+        if not user:
+            # Same bcrypt cost as a wrong password, so timing doesn't reveal which emails exist.
+            get_password_hasher().verify_dummy(password)
+            return jsonify({"error": "Invalid credentials."}), 401
+
+        if not user.check_password(password):
+            return jsonify({"error": "Invalid credentials."}), 401
+    except PasswordHasherBusy:
+        return _hasher_busy()
+
     access_token = create_access_token(identity=str(user.id))
     refresh_token = create_refresh_token(identity=str(user.id))
 
@@ -95,15 +151,9 @@ def refresh():
 @bp.get("/me")
 @jwt_required()
 def me():
-    """Return info about the currently authenticated user."""
-    user_id = int(get_jwt_identity())
-
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({"error": "User not found."}), 404
-
+    """Return info about the currently authenticated user (served from the user cache)."""
     return jsonify({
-        "id": user.id,
-        "email": user.email,
-        "created_at": user.created_at.isoformat()
+        "id": current_user.id,
+        "email": current_user.email,
+        "created_at": current_user.created_at.isoformat()
     }), 200
@@ -13,11 +13,16 @@ from ..models.candidate import RecurringCandidate
 from ..models.subscription import Subscription, ALLOWED_CADENCES
 from ..utils.validation import parse_amount
 from ..utils.normalize import normalize_merchant
+from ..utils.pagination import fetch_page
+from ..utils.summary import apply_subscription_change, subscription_snapshot
 
 
 # Blueprint for recurring candidate routes
 bp = Blueprint("candidates", __name__)
 
+# Keyset for list pagination: most confident first, id breaks ties
+CANDIDATE_SORT_KEYS = (("confidence", float), ("id", int))
+
 
 @bp.get("")
 @jwt_required()
@@ -26,18 +31,30 @@ def list_candidates():
     user_id = int(get_jwt_identity())
     status = request.args.get("status", "pending")
 
-    query = RecurringCandidate.query.filter_by(user_id=user_id)
+    criteria = [RecurringCandidate.user_id == user_id]
 
     # Status filtering lets the UI show separate queues (pending/confirmed/ignored).
     if status:
-        query = query.filter_by(status=status)
+        criteria.append(RecurringCandidate.status == status)
 
     # Highest-confidence candidates first to reduce review time.
-    candidates = query.order_by(
-        RecurringCandidate.confidence.desc()
-    ).all()
+    try:
+        candidates, next_cursor = fetch_page(
+            RecurringCandidate,
+            criteria,
+            CANDIDATE_SORT_KEYS,
+            request.args
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    response = jsonify(candidates)
+
+    # The body stays a plain list; the next page's cursor travels in a header.
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    return jsonify([c.to_dict() for c in candidates])
+    return response
 
 
 @bp.patch("/<int:cand_id>")
@@ -136,6 +153,7 @@ def confirm_candidate(cand_id):
     candidate.status = "confirmed"
     candidate.confirmed_subscription_id = subscription.id
 
+    apply_subscription_change(user_id, None, subscription_snapshot(subscription))
     db.session.commit()
 
     return jsonify({
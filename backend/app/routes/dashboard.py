@@ -6,33 +6,57 @@
 # Version: 0.1.0
 
 from datetime import date, timedelta
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
+from .. import db
 from ..models.subscription import Subscription
+from ..utils.recurrence import expand_upcoming
+from ..utils.summary import get_summary
 
 
 # Blueprint for dashboard summary routes
 bp = Blueprint("dashboard", __name__)
 
+# Rolling window shown on the dashboard itself, and the longest ?days= projection allowed
+UPCOMING_WINDOW_DAYS = 30
+MAX_UPCOMING_DAYS = 730
 
-def _monthly_equivalent(amount: float, cadence: str) -> float:
-    """Convert an amount + cadence into a monthly-equivalent cost.
 
-    Note: weekly uses 52/12 as an approximation (not 365.25/7), which is fine for
-    budgeting summaries but will never be perfectly exact month-to-month.
+def _upcoming_charges(user_id: int, start: date, end: date) -> list[dict]:
     """
-    if cadence == "weekly":
-        return amount * 52 / 12
-    if cadence == "monthly":
-        return amount
-    if cadence == "quarterly":
-        return amount / 3
-    if cadence == "yearly":
-        return amount / 12
+    Every projected charge of the user's active subscriptions in [start, end], by date.
 
-    # Fallback: treat unknown cadence as monthly to avoid breaking the dashboard.
-    return amount
+    Each subscription repeats from its stored next_due_date on its cadence, so a weekly
+    plan shows up once per week rather than once per window. Only the columns needed
+    are loaded; expansion is lazy and merged across subscriptions (utils/recurrence.py).
+    """
+    subs = {
+        row.id: row
+        for row in db.session.query(
+            Subscription.id,
+            Subscription.name,
+            Subscription.amount,
+            Subscription.cadence,
+            Subscription.next_due_date
+        ).filter(
+            Subscription.user_id == user_id,
+            Subscription.status == "active"
+        )
+    }
+
+    schedules = ((sub.id, sub.next_due_date, sub.cadence) for sub in subs.values())
+
+    return [
+        {
+            "subscription_id": sub_id,
+            "name": subs[sub_id].name,
+            "amount": float(subs[sub_id].amount),
+            "due_date": due.isoformat(),
+            "cadence": subs[sub_id].cadence,
+        }
+        for due, sub_id in expand_upcoming(schedules, start, end)
+    ]
 
 
 @bp.get("")
@@ -41,61 +65,47 @@ def dashboard():
     """Return a summary of active subscriptions and upcoming charges."""
     user_id = int(get_jwt_identity())
 
-    # Dashboard only considers active subscriptions to match the user's "current spend".
-    subscriptions = Subscription.query.filter_by(
-        user_id=user_id,
-        status="active"
-    ).all()
-
-    monthly_total = 0.0
-    annual_total = 0.0
+    # Totals, count and top list are maintained on write (see utils/summary.py),
+    # so only the date-dependent "upcoming" window is queried here.
+    summary = get_summary(user_id)
 
-    upcoming = []
     today = date.today()
-    window_end = today + timedelta(days=30)  # Rolling 30-day window for "upcoming" charges.
-
-    for sub in subscriptions:
-        amount = float(sub.amount)
-
-        # Compute totals in a cadence-agnostic way using monthly equivalents.
-        monthly_equiv = _monthly_equivalent(amount, sub.cadence)
-        monthly_total += monthly_equiv
-        annual_total += monthly_equiv * 12
-
-        # Upcoming charges are based on the stored next_due_date (no recurrence expansion here).
-        if today <= sub.next_due_date <= window_end:
-            upcoming.append({
-                "subscription_id": sub.id,
-                "name": sub.name,
-                "amount": amount,
-                "due_date": sub.next_due_date.isoformat(),
-                "cadence": sub.cadence,
-            })
-
-    # Sort by ISO date string for stable chronological ordering.
-    upcoming.sort(key=lambda x: x["due_date"])
-
-    # Surface the highest nominal charge amounts (not monthly-equivalent) for quick visibility.
-    top_subs = sorted(
-        subscriptions,
-        key=lambda s: float(s.amount),
-        reverse=True
-    )[:5]
-
-    top_list = [
-        {
-            "id": s.id,
-            "name": s.name,
-            "amount": float(s.amount),
-            "cadence": s.cadence
-        }
-        for s in top_subs
-    ]
+    upcoming = _upcoming_charges(user_id, today, today + timedelta(days=UPCOMING_WINDOW_DAYS))
 
     return jsonify({
-        "monthly_total": round(monthly_total, 2),
-        "annual_total": round(annual_total, 2),
-        "active_count": len(subscriptions),
+        "monthly_total": summary.monthly_total_cents / 100,
+        "annual_total": summary.annual_total_cents / 100,
+        "active_count": summary.active_count,
         "upcoming_30_days": upcoming,
-        "top_subscriptions": top_list,
+        "top_subscriptions": summary.top_subscriptions,
+    })
+
+
+@bp.get("/upcoming")
+@jwt_required()
+def upcoming():
+    """
+    Project active subscriptions' charges over the next ?days= days (default 30).
+
+    Returns the horizon, the projected total and every charge in date order.
+    """
+    user_id = int(get_jwt_identity())
+
+    try:
+        days = int(request.args.get("days", UPCOMING_WINDOW_DAYS))
+    except ValueError:
+        return jsonify({"error": "Days must be a whole number."}), 400
+
+    if not 1 <= days <= MAX_UPCOMING_DAYS:
+        return jsonify({"error": f"Days must be between 1 and {MAX_UPCOMING_DAYS}."}), 400
+
+    today = date.today()
+    end = today + timedelta(days=days)
+    charges = _upcoming_charges(user_id, today, end)
+
+    return jsonify({
+        "from": today.isoformat(),
+        "to": end.isoformat(),
+        "total": round(sum(c["amount"] for c in charges), 2),
+        "charges": charges,
     })
@@ -5,108 +5,84 @@
 # Date: February 5th 2026
 # Version: 0.1.0
 
-import csv
-import io
-from datetime import datetime
-
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from .. import db
-from ..models.transaction import TransactionImport, Transaction
-from ..models.candidate import RecurringCandidate
-from ..utils.normalize import normalize_merchant
-from ..utils.recurrence import detect_recurring
+from ..utils.importer import iter_import, run_import
+from ..utils.rate_limit import get_rate_limiter, rate_limited, too_many_requests
 
 
 # Blueprint for CSV import routes
 bp = Blueprint("imports", __name__)
 
+# Accept type that switches a synchronous upload to a stream of progress events
+NDJSON_MIMETYPE = "application/x-ndjson"
 
-def _parse_date(value: str):
-    """Parse a date in YYYY-MM-DD or MM/DD/YYYY format."""
-    value = (value or "").strip()
 
-    if not value:
-        raise ValueError("Missing date")
+def _import_slot(user_id: int) -> tuple[bool, str | None]:
+    """
+    Claim one of the user's MAX_CONCURRENT_IMPORTS slots; background jobs still queued or
+    running count against it. Like leases, a job stops counting once it has gone
+    IMPORT_SLOT_TTL_SECONDS without activity, so a crashed worker can't block the user.
+    Returns (admitted, lease id to release when done).
+    """
+    limit = current_app.config["MAX_CONCURRENT_IMPORTS"]
 
-    # Some exports include timestamps; keep only the date portion
-    # e.g. "02/05/2026 00:00:00" -> "02/05/2026"
-    value = value.split()[0].strip()
+    if limit <= 0:
+        return True, None
 
-    try:
-        if "-" in value:
-            return datetime.fromisoformat(value).date()
-        return datetime.strptime(value, "%m/%d/%Y").date()
-    except Exception:
-        raise ValueError(f"Invalid date: {value}")
+    ttl = current_app.config["IMPORT_SLOT_TTL_SECONDS"]
+    active_jobs = current_app.extensions["import_jobs"].queue.count_active(user_id, ttl)
+    lease_id = get_rate_limiter().acquire("import-slot", user_id, limit, held=active_jobs, ttl=ttl)
 
+    return lease_id is not None, lease_id
 
-def _parse_float(value):
-    """Parse a numeric string into float. Supports $ and commas and parentheses."""
-    if value is None:
-        return None
 
-    s = str(value).strip()
-    if not s:
-        return None
+def _release_slot(user_id: int, lease_id: str | None) -> None:
+    if lease_id is not None:
+        get_rate_limiter().release("import-slot", user_id, lease_id)
 
-    s = s.replace("$", "").replace(",", "").strip()
 
-    # Handle accounting format: (15.99)
-    if s.startswith("(") and s.endswith(")"):
-        s = "-" + s[1:-1]
+def _wants_ndjson() -> bool:
+    """True only when the client explicitly asks for NDJSON (a bare */* still gets JSON)."""
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
 
-    try:
-        return float(s)
-    except Exception:
-        return None
 
+def _wants_async(f, streaming: bool = False) -> bool:
+    """Decide whether an upload is handed to the background job queue."""
+    mode = (request.args.get("mode") or "").strip().lower()
 
-def _parse_amount_generic(value: str):
-    """Parse a transaction amount and return a positive float."""
-    amt = _parse_float(value)
-    if amt is None:
-        raise ValueError(f"Invalid amount: {value}")
+    if mode in {"sync", "async"}:
+        return mode == "async"
 
-    if amt == 0:
-        raise ValueError("Amount cannot be 0")
+    # A streaming client gets live progress on the open connection, so size doesn't matter.
+    if streaming:
+        return False
 
-    # Store positive amounts; directionality is handled by credit/debit logic upstream.
-    return round(abs(amt), 2)
+    # Default: small files keep the original synchronous behavior, big ones go to the queue
+    # so they don't tie up a web worker (or hit proxy timeouts).
+    size = request.content_length or f.content_length or 0
+    return size > current_app.config["IMPORT_ASYNC_THRESHOLD_BYTES"]
 
 
-def _clean_csv_text(raw_text: str) -> str:
-    """
-    Some bank CSVs include metadata lines before the actual header.
-    Strip leading lines until a header containing 'date' and an amount column is found.
+@bp.post("")
+@jwt_required()
+@rate_limited("imports", get_jwt_identity)
+def upload_csv():
     """
-    lines = [ln.strip("\ufeff").rstrip() for ln in raw_text.splitlines()]
-
-    header_idx = None
-    for i, ln in enumerate(lines):
-        if not ln or "," not in ln:
-            continue
-
-        lowered = ln.lower()
-        has_date = "date" in lowered
-        has_amount = ("amount" in lowered) or ("amount debit" in lowered) or ("amount credit" in lowered)
+    Accept a CSV upload, save transactions, and generate recurring candidates.
 
-        # This heuristic keeps imports resilient across common bank formats without hardcoding a single schema.
-        if has_date and has_amount:
-            header_idx = i
-            break
+    Large files (or ?mode=async) are spooled to disk and imported in the background;
+    the response is 202 with a job id to poll at GET /api/imports/<job_id>.
 
-    if header_idx is None:
-        return raw_text
+    With `Accept: application/x-ndjson` the import runs on this request instead and the
+    response streams progress events (parse/write per chunk, merchant history, detection)
+    followed by the final {"event": "done", ...} summary.
 
-    return "\n".join(lines[header_idx:])
-
-
-@bp.post("")
-@jwt_required()
-def upload_csv():
-    """Accept a CSV upload, save transactions, and generate recurring candidates."""
+    Uploads are rate limited per user (429 with Retry-After), and a user may only have
+    MAX_CONCURRENT_IMPORTS imports in flight at once, background jobs included.
+    """
     user_id = int(get_jwt_identity())
 
     if "file" not in request.files:
@@ -119,163 +95,77 @@ def upload_csv():
     if not f.filename:
         return jsonify({"error": "File must have a filename."}), 400
 
-    # errors="ignore" prevents uploads from failing due to odd encodings; rows that can't be parsed are skipped.
-    content_raw = f.read().decode("utf-8", errors="ignore")
-    content = _clean_csv_text(content_raw)
+    streaming = _wants_ndjson()
 
-    reader = csv.DictReader(io.StringIO(content))
+    admitted, lease_id = _import_slot(user_id)
+    if not admitted:
+        return too_many_requests("Too many imports in progress. Wait for one to finish.", 5)
 
-    # Support common CSV headers (case-insensitive)
-    date_keys = {"date", "transaction_date", "posted_date"}
+    if _wants_async(f, streaming):
+        # Once enqueued, the job itself counts against the limit (see _import_slot).
+        jobs = current_app.extensions["import_jobs"]
 
-    # Memo often contains the most useful merchant string. Fall back to Description.
-    merchant_keys = {"merchant", "memo", "description", "name"}
+        try:
+            job_id = jobs.submit(user_id, f)
+        finally:
+            _release_slot(user_id, lease_id)
 
-    # Traditional single amount column
-    amount_keys = {"amount", "transaction_amount"}
+        return jsonify(jobs.queue.get(job_id, user_id)), 202, {
+            "Location": f"/api/imports/{job_id}"
+        }
 
-    # Split debit/credit exports
-    debit_keys = {"amount debit", "debit", "withdrawal", "debits"}
-    credit_keys = {"amount credit", "credit", "deposit", "credits"}
+    if streaming:
+        return _stream_import(user_id, f, lease_id)
+
+    try:
+        return jsonify(run_import(user_id, f.filename, f.stream)), 201
+    finally:
+        _release_slot(user_id, lease_id)
 
-    import_record = TransactionImport(
-        user_id=user_id,
-        filename=f.filename
-    )
 
-    db.session.add(import_record)
-    db.session.flush()  # Ensures import_record.id exists for Transaction.import_id FK references.
+def _stream_import(user_id: int, f, lease_id: str | None = None) -> Response:
+    """
+    Run the import while streaming its events as NDJSON, one JSON object per line.
 
-    rows_added = 0
-    rows_skipped = 0
+    Each chunk's progress event is written as soon as it's produced, so memory stays
+    bounded by the importer's chunk size rather than the file size. The status line is
+    already sent when the import starts; failures arrive as a final {"event": "error"}.
+    The import slot is released when the server closes the response, which happens even
+    if the client goes away before the body is ever iterated.
+    """
+    def events():
+        try:
+            for event in iter_import(user_id, f.filename, f.stream):
+                yield current_app.json.dumps(event) + "\n"
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.exception("Streaming import failed")
+            yield current_app.json.dumps({"event": "error", "error": str(e) or e.__class__.__name__}) + "\n"
+
+    # No buffering in front of us (nginx), or the client would see every event at the end.
+    response = Response(
+        stream_with_context(events()),
+        mimetype=NDJSON_MIMETYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-    # Accumulate per-merchant charge history for recurrence detection.
-    by_merchant = {}
-    display_names = {}
+    # Close callbacks run after the app context is gone, so the limiter is bound here.
+    if lease_id is not None:
+        limiter = get_rate_limiter()
+        response.call_on_close(lambda: limiter.release("import-slot", user_id, lease_id))
 
-    for row in reader:
-        # Map normalized key -> original key in the CSV row so we can do case-insensitive header matching.
-        keys = {(k or "").lower().strip(): k for k in row.keys() if k}
+    return response
 
-        def pick(options):
-            for opt in options:
-                if opt in keys:
-                    return row.get(keys[opt])
-            return None
 
-        date_val = pick(date_keys)
-        merch_val = pick(merchant_keys)
+@bp.get("/<job_id>")
+@jwt_required()
+def import_status(job_id):
+    """Return status and progress counters for a background import job."""
+    user_id = int(get_jwt_identity())
 
-        # Amount handling: prefer a single amount column; otherwise use debit/credit.
-        amt_val = pick(amount_keys)
-        debit_val = pick(debit_keys)
-        credit_val = pick(credit_keys)
+    job = current_app.extensions["import_jobs"].queue.get(job_id, user_id)
 
-        if not date_val or not merch_val:
-            rows_skipped += 1
-            continue
+    if not job:
+        return jsonify({"error": "Import job not found."}), 404
 
-        try:
-            txn_date = _parse_date(date_val)
-
-            amount = None
-            include_in_detection = True
-
-            if amt_val is not None and str(amt_val).strip():
-                amount = _parse_amount_generic(amt_val)
-            else:
-                debit_amt = _parse_float(debit_val)
-                credit_amt = _parse_float(credit_val)
-
-                if debit_amt is not None and debit_amt != 0:
-                    amount = round(abs(debit_amt), 2)
-                elif credit_amt is not None and credit_amt != 0:
-                    # Credits are saved for completeness, but excluded from recurring *charge* detection
-                    # (avoids treating payroll/deposits/refunds as "subscriptions").
-                    amount = round(abs(credit_amt), 2)
-                    include_in_detection = False
-                else:
-                    raise ValueError("Missing amount")
-
-            merchant_raw = str(merch_val).strip()
-            if not merchant_raw:
-                raise ValueError("Missing merchant")
-
-            merchant_key = normalize_merchant(merchant_raw)
-
-        except Exception:
-            rows_skipped += 1
-            continue
-
-        txn = Transaction(
-            user_id=user_id,
-            import_id=import_record.id,
-            txn_date=txn_date,
-            merchant_raw=merchant_raw[:255],
-            merchant_key=merchant_key,
-            amount=amount,
-        )
-
-        db.session.add(txn)
-        rows_added += 1
-
-        if include_in_detection:
-            by_merchant.setdefault(merchant_key, []).append((txn_date, amount))
-            display_names.setdefault(merchant_key, merchant_raw)
-
-    db.session.flush()  # Persist transactions before running detection (keeps import atomic if detection fails later).
-
-    candidates_created = 0
-    candidates_updated = 0
-
-    for merchant_key, charges in by_merchant.items():
-        display_name = display_names.get(merchant_key, merchant_key)
-
-        result = detect_recurring(
-            merchant_key,
-            display_name,
-            charges
-        )
-
-        if not result:
-            continue
-
-        # Keep at most one pending candidate per merchant to prevent duplicate review items after multiple imports.
-        existing = RecurringCandidate.query.filter_by(
-            user_id=user_id,
-            merchant_key=result.merchant_key,
-            status="pending"
-        ).first()
-
-        if existing:
-            existing.display_name = result.display_name[:160]
-            existing.avg_amount = result.avg_amount
-            existing.cadence_guess = result.cadence_guess
-            existing.confidence = result.confidence
-            existing.last_seen = result.last_seen
-            existing.next_predicted = result.next_predicted
-            candidates_updated += 1
-        else:
-            cand = RecurringCandidate(
-                user_id=user_id,
-                merchant_key=result.merchant_key,
-                display_name=result.display_name[:160],
-                avg_amount=result.avg_amount,
-                cadence_guess=result.cadence_guess,
-                confidence=result.confidence,
-                last_seen=result.last_seen,
-                next_predicted=result.next_predicted,
-                status="pending",
-            )
-            db.session.add(cand)
-            candidates_created += 1
-
-    db.session.commit()
-
-    return jsonify({
-        "import": import_record.to_dict(),
-        "rows_added": rows_added,
-        "rows_skipped": rows_skipped,
-        "candidates_created": candidates_created,
-        "candidates_updated": candidates_updated,
-    }), 201
+    return jsonify(job)
@@ -5,35 +5,50 @@
 # Date: February 5th 2026
 # Version: 0.1.0
 
+from datetime import datetime
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from .. import db
 from ..models.subscription import Subscription, ALLOWED_CADENCES
 from ..utils.normalize import normalize_merchant
+from ..utils.pagination import fetch_page
+from ..utils.summary import apply_subscription_change, subscription_snapshot
 from ..utils.validation import parse_date, parse_amount
 
 
 # Blueprint for subscription CRUD routes
 bp = Blueprint("subscriptions", __name__)
 
+# Keyset for list pagination: newest first, id breaks ties
+SUBSCRIPTION_SORT_KEYS = (("created_at", datetime.fromisoformat), ("id", int))
+
 
 @bp.get("")
 @jwt_required()
 def list_subscriptions():
-    """Return subscriptions for the current user."""
+    """Return subscriptions for the current user (newest first, optionally paginated)."""
     user_id = int(get_jwt_identity())
     status = request.args.get("status")
 
-    query = Subscription.query.filter_by(user_id=user_id)
+    criteria = [Subscription.user_id == user_id]
 
     # Optional status filter supports UI tabs (active vs canceled).
     if status:
-        query = query.filter_by(status=status)
+        criteria.append(Subscription.status == status)
 
-    subs = query.order_by(Subscription.created_at.desc()).all()
+    try:
+        subs, next_cursor = fetch_page(Subscription, criteria, SUBSCRIPTION_SORT_KEYS, request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    return jsonify([s.to_dict() for s in subs])
+    response = jsonify(subs)
+
+    # The body stays a plain list; the next page's cursor travels in a header.
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return response
 
 
 @bp.post("")
@@ -81,6 +96,7 @@ def create_subscription():
     )
 
     db.session.add(sub)
+    apply_subscription_change(user_id, None, subscription_snapshot(sub))
     db.session.commit()
 
     return jsonify(sub.to_dict()), 201
@@ -98,6 +114,7 @@ def update_subscription(sub_id):
         return jsonify({"error": "Subscription not found."}), 404
 
     data = request.get_json(silent=True) or {}
+    before = subscription_snapshot(sub)  # Dashboard summary is adjusted by the difference.
 
     if "name" in data:
         name = (data.get("name") or "").strip()
@@ -144,6 +161,7 @@ def update_subscription(sub_id):
 
         sub.status = status
 
+    apply_subscription_change(user_id, before, subscription_snapshot(sub))
     db.session.commit()
 
     return jsonify(sub.to_dict())
@@ -160,7 +178,10 @@ def delete_subscription(sub_id):
     if not sub or sub.user_id != user_id:
         return jsonify({"error": "Subscription not found."}), 404
 
+    before = subscription_snapshot(sub)
+
     db.session.delete(sub)
+    apply_subscription_change(user_id, before, None)
     db.session.commit()
 
     return jsonify({"deleted": True})
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import date
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, InvalidOperation
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from ..models.transaction import Transaction
+from ..utils.money import decimal_to_cents
+from ..utils.normalize import normalize_merchant_prefix
+from ..utils.pagination import fetch_page
+from ..utils.validation import parse_date
+
+
+# Blueprint for imported transaction history routes
+bp = Blueprint("transactions", __name__)
+
+# Keyset for list pagination: newest transactions first, id breaks ties
+TRANSACTION_SORT_KEYS = (("txn_date", date.fromisoformat), ("id", int))
+
+# Page size when the client doesn't pass ?limit= (history can run to millions of rows)
+DEFAULT_TRANSACTION_LIMIT = 100
+
+
+def _parse_amount_filter(value, label: str, rounding: str):
+    """Parse an optional dollar bound into integer cents; raises ValueError if invalid."""
+    if value is None or value == "":
+        return None
+
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid {label}.")
+
+    if not amount.is_finite():
+        raise ValueError(f"Invalid {label}.")
+
+    # Sub-cent bounds round inward so the range stays inclusive of exactly what was asked.
+    return decimal_to_cents(amount, rounding)
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix (for an index range)."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@bp.get("")
+@jwt_required()
+def list_transactions():
+    """
+    Return imported transactions for the current user, newest first, one page at a time.
+
+    Filters (all optional):
+    - from / to: inclusive txn_date range
+    - merchant: merchant_key prefix (case and punctuation folded like imported merchants)
+    - min_amount / max_amount: inclusive amount range
+    - import_id: only rows from one CSV import
+    """
+    user_id = int(get_jwt_identity())
+    args = request.args
+
+    criteria = [Transaction.user_id == user_id]
+
+    try:
+        if args.get("from"):
+            criteria.append(Transaction.txn_date >= parse_date(args["from"]))
+
+        if args.get("to"):
+            criteria.append(Transaction.txn_date <= parse_date(args["to"]))
+
+        min_cents = _parse_amount_filter(args.get("min_amount"), "min_amount", ROUND_CEILING)
+        if min_cents is not None:
+            criteria.append(Transaction.amount_cents >= min_cents)
+
+        max_cents = _parse_amount_filter(args.get("max_amount"), "max_amount", ROUND_FLOOR)
+        if max_cents is not None:
+            criteria.append(Transaction.amount_cents <= max_cents)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if args.get("import_id"):
+        try:
+            criteria.append(Transaction.import_id == int(args["import_id"]))
+        except ValueError:
+            return jsonify({"error": "Invalid import_id."}), 400
+
+    # Prefix search as a plain range so it can use ix_transactions_user_merchant_date
+    # (SQLite won't use an index for a case-sensitive LIKE).
+    prefix = normalize_merchant_prefix(args.get("merchant") or "")
+    if prefix:
+        criteria.append(Transaction.merchant_key >= prefix)
+        criteria.append(Transaction.merchant_key < _prefix_upper_bound(prefix))
+
+    try:
+        transactions, next_cursor = fetch_page(
+            Transaction,
+            criteria,
+            TRANSACTION_SORT_KEYS,
+            args,
+            default_limit=DEFAULT_TRANSACTION_LIMIT
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    response = jsonify(transactions)
+
+    # The body stays a plain list; the next page's cursor travels in a header.
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return response
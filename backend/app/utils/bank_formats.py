@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+# Compiled plans are cached per distinct header, so repeat uploads skip column resolution.
+PLAN_CACHE_SIZE = 256
+
+# Generic header names, in order of preference, for exports without a registered profile.
+# Memo often contains the most useful merchant string. Fall back to Description.
+DATE_COLUMNS = ("date", "transaction_date", "posted_date")
+MERCHANT_COLUMNS = ("merchant", "memo", "description", "name")
+
+# Traditional single amount column
+AMOUNT_COLUMNS = ("amount", "transaction_amount")
+
+# Split debit/credit exports
+DEBIT_COLUMNS = ("amount debit", "debit", "withdrawal", "debits")
+CREDIT_COLUMNS = ("amount credit", "credit", "deposit", "credits")
+
+
+@dataclass(frozen=True)
+class BankProfile:
+    """
+    Column layout of one bank's CSV export.
+
+    `header` is the export's exact header row; it is what uploads are matched on.
+    Merchant columns are tried in order and the first non-empty value wins. Either
+    `amount` or `debit`/`credit` should be set. `date_format` is a strptime format,
+    or None to fall back to the generic date parser.
+    """
+
+    name: str
+    header: tuple[str, ...]
+    date: str
+    merchant: tuple[str, ...]
+    amount: str | None = None
+    debit: str | None = None
+    credit: str | None = None
+    date_format: str | None = None
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """Header resolved to positions once per file; the row loop only indexes tuples with it."""
+
+    profile: str | None
+    width: int
+    date_idx: int | None
+    merchant_idxs: tuple[int, ...]
+    amount_idx: int | None
+    debit_idx: int | None
+    credit_idx: int | None
+    date_format: str | None
+
+
+def _normalize_cell(cell: str) -> str:
+    return (cell or "").strip().strip("\ufeff").lower()
+
+
+def header_signature(header) -> str:
+    """Stable hash of a header row (case/whitespace-insensitive) used as the profile key."""
+    normalized = "\x1f".join(_normalize_cell(c) for c in header)
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+
+# Built-in profiles for common exports; register_profile() adds more.
+BUILTIN_PROFILES = (
+    BankProfile(
+        name="chase_card",
+        header=("Transaction Date", "Post Date", "Description", "Category", "Type", "Amount", "Memo"),
+        date="Transaction Date",
+        merchant=("Description", "Memo"),
+        amount="Amount",
+        date_format="%m/%d/%Y",
+    ),
+    BankProfile(
+        name="capital_one_card",
+        header=("Transaction Date", "Posted Date", "Card No.", "Description", "Category", "Debit", "Credit"),
+        date="Transaction Date",
+        merchant=("Description",),
+        debit="Debit",
+        credit="Credit",
+        date_format="%Y-%m-%d",
+    ),
+    BankProfile(
+        name="discover_card",
+        header=("Trans. Date", "Post Date", "Description", "Amount", "Category"),
+        date="Trans. Date",
+        merchant=("Description",),
+        amount="Amount",
+        date_format="%m/%d/%Y",
+    ),
+    BankProfile(
+        name="bank_of_america_checking",
+        header=("Date", "Description", "Amount", "Running Bal."),
+        date="Date",
+        merchant=("Description",),
+        amount="Amount",
+        date_format="%m/%d/%Y",
+    ),
+)
+
+_profiles_by_signature = {}
+
+
+def register_profile(profile: BankProfile) -> None:
+    """Add (or replace) a bank profile; uploads with exactly this header will use it."""
+    _profiles_by_signature[header_signature(profile.header)] = profile
+    _compile_plan.cache_clear()
+
+
+def _plan_from_profile(profile: BankProfile, cells: tuple[str, ...]) -> ColumnPlan:
+    index = {cell: i for i, cell in enumerate(cells)}
+
+    def find(column):
+        return index.get(_normalize_cell(column)) if column else None
+
+    return ColumnPlan(
+        profile=profile.name,
+        width=len(cells),
+        date_idx=find(profile.date),
+        merchant_idxs=tuple(i for i in map(find, profile.merchant) if i is not None),
+        amount_idx=find(profile.amount),
+        debit_idx=find(profile.debit),
+        credit_idx=find(profile.credit),
+        date_format=profile.date_format,
+    )
+
+
+def _plan_from_heuristics(cells: tuple[str, ...]) -> ColumnPlan:
+    # Later duplicates lose, so the first column with a given name is used.
+    index = {}
+    for i, cell in enumerate(cells):
+        index.setdefault(cell, i)
+
+    def first(options):
+        return next((index[o] for o in options if o in index), None)
+
+    return ColumnPlan(
+        profile=None,
+        width=len(cells),
+        date_idx=first(DATE_COLUMNS),
+        merchant_idxs=tuple(index[o] for o in MERCHANT_COLUMNS if o in index),
+        amount_idx=first(AMOUNT_COLUMNS),
+        debit_idx=first(DEBIT_COLUMNS),
+        credit_idx=first(CREDIT_COLUMNS),
+        date_format=None,
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(cells: tuple[str, ...]) -> ColumnPlan:
+    profile = _profiles_by_signature.get(header_signature(cells))
+
+    if profile is not None:
+        return _plan_from_profile(profile, cells)
+
+    return _plan_from_heuristics(cells)
+
+
+def compile_plan(header) -> ColumnPlan:
+    """
+    Resolve a CSV header row into a ColumnPlan.
+
+    A registered profile whose header signature matches is used as-is; anything else
+    goes through the generic column-name heuristics. Results are cached per header.
+    """
+    return _compile_plan(tuple(_normalize_cell(c) for c in header))
+
+
+def is_known_header(header) -> bool:
+    """True if the row is the header of a registered bank profile."""
+    return header_signature(header) in _profiles_by_signature
+
+
+for _profile in BUILTIN_PROFILES:
+    register_profile(_profile)
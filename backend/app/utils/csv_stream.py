@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import csv
+import io
+from itertools import chain
+
+from .bank_formats import is_known_header
+
+
+# Bank exports put a handful of metadata lines (account number, date range, ...) above the
+# real header. We only buffer this many lines while looking for it so memory stays bounded.
+HEADER_LOOKAHEAD_LINES = 50
+
+
+def _looks_like_header(line: str) -> bool:
+    """Return True if a raw CSV line looks like a transaction header row."""
+    ln = line.strip("\ufeff").rstrip()
+
+    if not ln or "," not in ln:
+        return False
+
+    lowered = ln.lower()
+    has_date = "date" in lowered
+    has_amount = ("amount" in lowered) or ("amount debit" in lowered) or ("amount credit" in lowered)
+
+    # This heuristic keeps imports resilient across common bank formats without hardcoding a single schema.
+    if has_date and has_amount:
+        return True
+
+    # Registered bank profiles (e.g. Debit/Credit exports with no "amount" column) match exactly.
+    return is_known_header(next(csv.reader([ln])))
+
+
+def open_csv_stream(binary_stream, lookahead: int = HEADER_LOOKAHEAD_LINES):
+    """
+    Wrap a binary upload stream in a csv.reader without reading the whole file into memory.
+
+    Bytes are decoded incrementally; leading metadata lines are skipped until a header
+    (containing 'date' and an amount column, or a registered bank profile's header) is
+    found. The first row the reader yields is that header. If no header shows up within
+    the lookahead window, the file is parsed from the top as a plain CSV.
+    """
+    # errors="ignore" prevents uploads from failing due to odd encodings; rows that can't be parsed are skipped.
+    # utf-8-sig drops a leading BOM so it doesn't end up glued to the first header name.
+    text = io.TextIOWrapper(
+        binary_stream,
+        encoding="utf-8-sig",
+        errors="ignore",
+        newline=""
+    )
+
+    buffered = []
+
+    for line in text:
+        if _looks_like_header(line):
+            return csv.reader(chain([line], text))
+
+        buffered.append(line)
+        if len(buffered) >= lookahead:
+            break
+
+    # No recognizable header in the lookahead window: replay what we buffered.
+    return csv.reader(chain(buffered, text))
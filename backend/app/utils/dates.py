@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import date, datetime
+
+
+# Rows parsed the slow way while a file's date format is being inferred
+DATE_SAMPLE_ROWS = 20
+
+# A statement has a few thousand distinct dates at most; past this the memo is reset
+# rather than left to grow on pathological input.
+DATE_MEMO_MAX = 50_000
+
+
+def parse_date_generic(value: str, date_format: str | None = None) -> date:
+    """Parse a date in the bank profile's format if known, else YYYY-MM-DD or MM/DD/YYYY."""
+    value = (value or "").strip()
+
+    if not value:
+        raise ValueError("Missing date")
+
+    # Some exports include timestamps; keep only the date portion
+    # e.g. "02/05/2026 00:00:00" -> "02/05/2026"
+    value = value.split()[0].strip()
+
+    if date_format:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            pass  # Profile format didn't match this row; try the generic formats.
+
+    try:
+        if "-" in value:
+            return datetime.fromisoformat(value).date()
+        return datetime.strptime(value, "%m/%d/%Y").date()
+    except Exception:
+        raise ValueError(f"Invalid date: {value}")
+
+
+def _parse_iso(value: str) -> date:
+    """Fixed-width YYYY-MM-DD."""
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(value)
+    return date.fromisoformat(value)
+
+
+def _parse_us(value: str) -> date:
+    """Fixed-width MM/DD/YYYY, sliced straight into ints."""
+    if len(value) != 10 or value[2] != "/" or value[5] != "/":
+        raise ValueError(value)
+    return date(int(value[6:10]), int(value[0:2]), int(value[3:5]))
+
+
+# Specialized parsers a file can be locked onto, in the order they're tried
+FAST_PARSERS = (_parse_iso, _parse_us)
+
+
+class DateParser:
+    """
+    Per-file date parser.
+
+    The first DATE_SAMPLE_ROWS values go through parse_date_generic; each fast parser
+    that agrees with it on every sample stays a candidate, and the first survivor is
+    used for the rest of the file. A value the fast parser rejects falls back to the
+    generic path, so a mismatch costs speed, never correctness. Results are memoized
+    per raw string since statements repeat the same few dates many times.
+    """
+
+    def __init__(self, date_format: str | None = None, sample_rows: int = DATE_SAMPLE_ROWS):
+        self.date_format = date_format
+        self.sample_rows = sample_rows
+        self.fast = None
+        self._candidates = list(FAST_PARSERS)
+        self._sampled = 0
+        self._memo = {}
+
+    def _sample(self, value: str) -> date:
+        parsed = parse_date_generic(value, self.date_format)
+        stripped = value.strip()
+
+        # A parser that rejects or disagrees with any sample is out for this file.
+        survivors = []
+        for parser in self._candidates:
+            try:
+                if parser(stripped) == parsed:
+                    survivors.append(parser)
+            except ValueError:
+                pass
+        self._candidates = survivors
+
+        self._sampled += 1
+        if self._sampled >= self.sample_rows or not survivors:
+            self.fast = survivors[0] if survivors else None
+            self._candidates = None
+
+        return parsed
+
+    def __call__(self, value: str) -> date:
+        memo = self._memo
+        parsed = memo.get(value)
+        if parsed is not None:
+            return parsed
+
+        if self._candidates is not None:
+            parsed = self._sample(value)
+        elif self.fast is not None:
+            try:
+                parsed = self.fast(value)
+            except ValueError:
+                parsed = parse_date_generic(value, self.date_format)
+        else:
+            parsed = parse_date_generic(value, self.date_format)
+
+        if len(memo) >= DATE_MEMO_MAX:
+            memo.clear()
+        memo[value] = parsed
+
+        return parsed
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import hashlib
+import math
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import select
+
+from .. import db
+
+
+# Rows read per batch while (re)filling the filter from the users table
+WARM_BATCH_SIZE = 10_000
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized up front for `capacity` items at `error_rate` false positives; it never reports
+    a false negative, so "not present" can be trusted and "present" means "check the DB".
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class KnownEmails:
+    """
+    Negative cache of registered emails for login.
+
+    Filled from the users table on first use (by id, so later refreshes only read new
+    rows) and kept current by register(). Accounts created by another worker process
+    are picked up by an incremental refresh when a lookup misses, at most once every
+    `refresh_seconds`, so a miss costs a DB round trip only that often.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, refresh_seconds: float):
+        self.filter = BloomFilter(capacity, error_rate)
+        self.refresh_seconds = refresh_seconds
+        self.last_id = 0
+        self.warmed = False
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, email: str) -> None:
+        self.filter.add(email)
+
+    def _refresh(self) -> None:
+        """Add users with id > last_id to the filter (reads only new rows, via the primary key)."""
+        from ..models.user import User
+
+        while True:
+            rows = db.session.execute(
+                select(User.id, User.email)
+                .where(User.id > self.last_id)
+                .order_by(User.id)
+                .limit(WARM_BATCH_SIZE)
+            ).all()
+
+            for user_id, email in rows:
+                self.filter.add(email)
+                self.last_id = user_id
+
+            if len(rows) < WARM_BATCH_SIZE:
+                break
+
+        self.warmed = True
+        self._refreshed_at = time.monotonic()
+
+    def might_exist(self, email: str) -> bool:
+        """False only if no account with this email exists (as of the last refresh)."""
+        if self.warmed and email in self.filter:
+            return True
+
+        with self._lock:
+            due = time.monotonic() - self._refreshed_at >= self.refresh_seconds
+            if not self.warmed or due:
+                self._refresh()
+
+        return email in self.filter
+
+
+def get_known_emails() -> KnownEmails:
+    return current_app.extensions["known_emails"]
+
+
+def init_known_emails(app) -> None:
+    """Create the app's email filter from EMAIL_FILTER_CAPACITY / _ERROR_RATE / _REFRESH_SECONDS."""
+    app.extensions["known_emails"] = KnownEmails(
+        capacity=app.config["EMAIL_FILTER_CAPACITY"],
+        error_rate=app.config["EMAIL_FILTER_ERROR_RATE"],
+        refresh_seconds=app.config["EMAIL_FILTER_REFRESH_SECONDS"]
+    )
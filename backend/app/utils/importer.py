@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import hashlib
+from array import array
+from datetime import date
+
+from flask import current_app
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .. import db
+from ..models.transaction import TransactionImport, Transaction
+from ..models.candidate import RecurringCandidate
+from ..models.merchant_history import MerchantHistory
+from .bank_formats import compile_plan
+from .csv_stream import open_csv_stream
+from .dates import DateParser
+from .money import cents_to_decimal
+from .normalize import normalize_many
+from .profiling import phase
+from .recurrence import ChargeColumns, detect_recurring_parallel, merge_history, summarize_history
+
+
+# Transactions are written in fixed-size batches through Core executemany so a large import
+# never builds one ORM object (and identity-map entry) per row.
+TXN_INSERT_CHUNK_SIZE = 2000
+
+# Keeps IN (...) lists well under SQLite's bound-parameter limit.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def _parse_cents(value):
+    """
+    Parse a money string into signed integer cents. Supports $ and commas and parentheses.
+
+    Plain decimals are split and converted digit-wise so no float rounding is involved
+    (extra fraction digits round half up); anything else (e.g. "1e3") goes through float.
+    """
+    if value is None:
+        return None
+
+    s = str(value).strip()
+    if not s:
+        return None
+
+    s = s.replace("$", "").replace(",", "").strip()
+
+    # Handle accounting format: (15.99)
+    negative = False
+    if s.startswith("(") and s.endswith(")"):
+        s = s[1:-1].strip()
+        negative = True
+
+    if s[:1] in ("-", "+"):
+        negative = negative != (s[0] == "-")
+        s = s[1:]
+
+    whole, _, frac = s.partition(".")
+
+    if (whole.isdigit() or (not whole and frac)) and (frac.isdigit() or not frac):
+        cents = int(whole or 0) * 100 + int((frac + "00")[:2])
+        if frac[2:3] >= "5":
+            cents += 1
+    else:
+        try:
+            cents = round(float(s) * 100)
+        except Exception:
+            return None
+
+    return -cents if negative else cents
+
+
+def _parse_amount_cents(value: str) -> int:
+    """Parse a transaction amount and return positive integer cents."""
+    cents = _parse_cents(value)
+    if cents is None:
+        raise ValueError(f"Invalid amount: {value}")
+
+    if cents == 0:
+        raise ValueError("Amount cannot be 0")
+
+    # Store positive amounts; directionality is handled by credit/debit logic upstream.
+    return abs(cents)
+
+
+def _load_by_merchant_key(model, user_id: int, merchant_keys: list[str], **filters) -> dict:
+    """
+    Load a user's rows of `model` for the given merchant keys in a handful of IN queries
+    (one per IN_CLAUSE_CHUNK_SIZE keys) instead of one query per merchant.
+    Returns {merchant_key: row}.
+    """
+    rows_by_key = {}
+
+    for i in range(0, len(merchant_keys), IN_CLAUSE_CHUNK_SIZE):
+        chunk = merchant_keys[i:i + IN_CLAUSE_CHUNK_SIZE]
+
+        rows = model.query.filter_by(user_id=user_id, **filters).filter(
+            model.merchant_key.in_(chunk)
+        ).all()
+
+        rows_by_key.update({r.merchant_key: r for r in rows})
+
+    return rows_by_key
+
+
+def fingerprint_merchant(merchant_raw: str) -> str:
+    """Merchant text as fingerprinted: case and whitespace differences between exports are ignored."""
+    return " ".join(merchant_raw.upper().split())
+
+
+def transaction_fingerprint(user_id: int, txn_date: date, cents: int, merchant: str, occurrence: int) -> str:
+    """
+    Content hash identifying a transaction across overlapping exports.
+
+    `merchant` is fingerprint_merchant(merchant_raw). `occurrence` numbers identical
+    (date, amount, merchant) rows within one file, so two genuine same-day purchases both
+    survive while re-uploading the same export adds nothing. Amounts are hashed as integer
+    cents so float formatting can't change a fingerprint.
+    """
+    content = f"{user_id}|{txn_date.isoformat()}|{cents}|{merchant}|{occurrence}"
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _insert_ignoring_duplicates(table):
+    """INSERT that silently skips rows whose (user_id, fingerprint) already exists."""
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing(index_elements=["user_id", "fingerprint"])
+    if dialect == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing(index_elements=["user_id", "fingerprint"])
+
+    # MySQL/MariaDB
+    return table.insert().prefix_with("IGNORE")
+
+
+def iter_import(user_id: int, filename: str, binary_stream):
+    """
+    Import a CSV stream: save transactions and generate recurring candidates.
+
+    This is a generator so callers can report progress. It yields a
+    {"event": "progress", ...} dict after every inserted chunk, once merchant history
+    is merged and after detection, then commits and yields a final {"event": "done", ...}
+    summary.
+    """
+    # Rows are decoded and parsed as they are read so large exports never sit in memory as one string.
+    reader = open_csv_stream(binary_stream)
+
+    # Resolve the header to column positions once (a known bank profile, or the generic
+    # case-insensitive column names); the row loop below only indexes into each row.
+    plan = compile_plan(next(reader, None) or [])
+    date_idx = plan.date_idx
+    merchant_idxs = plan.merchant_idxs
+    amount_idx = plan.amount_idx
+    debit_idx = plan.debit_idx
+    credit_idx = plan.credit_idx
+    parse_date = DateParser(plan.date_format)
+    width = plan.width
+
+    import_record = TransactionImport(
+        user_id=user_id,
+        filename=filename
+    )
+
+    db.session.add(import_record)
+    db.session.flush()  # Ensures import_record.id exists for Transaction.import_id FK references.
+
+    rows_parsed = 0
+    rows_added = 0
+    rows_skipped = 0
+    rows_deduplicated = 0
+    merchants_scored = 0
+
+    def progress(phase: str) -> dict:
+        return {
+            "event": "progress",
+            "phase": phase,
+            "rows_parsed": rows_parsed,
+            "rows_written": rows_added,
+            "merchants_scored": merchants_scored,
+        }
+
+    txn_table = Transaction.__table__
+    txn_insert = _insert_ignoring_duplicates(txn_table)
+
+    # How many times each identical (date, amount, merchant) row has appeared in this file so far.
+    occurrences = {}
+
+    # Accumulate per-merchant charge history for recurrence detection (compact typed arrays;
+    # a million-row import keeps every new charge here until detection).
+    by_merchant = {}
+    display_names = {}
+
+    def write_chunk(parsed):
+        """
+        Normalize a chunk of parsed rows in one batch, insert the ones not already stored,
+        and collect detection inputs for those.
+        """
+        nonlocal rows_added, rows_deduplicated
+
+        with phase("normalize"):
+            chunk_keys = normalize_many(merchant_raw for _, _, merchant_raw, _ in parsed)
+
+        with phase("fingerprint"):
+            rows = []
+            detection = []
+
+            for (txn_date, cents, merchant_raw, include_in_detection), merchant_key in zip(parsed, chunk_keys):
+                merchant_raw = merchant_raw[:255]
+
+                merchant = fingerprint_merchant(merchant_raw)
+
+                # Keyed by the values themselves: hash() of a str is salted per process, and
+                # occurrence numbers must come out the same on every import of the same file.
+                identity = (txn_date, cents, merchant)
+                occurrence = occurrences.get(identity, 0)
+                occurrences[identity] = occurrence + 1
+
+                rows.append({
+                    "user_id": user_id,
+                    "import_id": import_record.id,
+                    "txn_date": txn_date,
+                    "merchant_raw": merchant_raw,
+                    "merchant_key": merchant_key,
+                    "amount_cents": cents,
+                    "fingerprint": transaction_fingerprint(user_id, txn_date, cents, merchant, occurrence),
+                })
+                detection.append((include_in_detection, merchant_key, txn_date, cents, merchant_raw))
+
+        with phase("insert"):
+            # One IN query per chunk finds rows an earlier import already stored.
+            existing = {
+                fp for (fp,) in db.session.query(Transaction.fingerprint).filter(
+                    Transaction.user_id == user_id,
+                    Transaction.fingerprint.in_([r["fingerprint"] for r in rows])
+                )
+            }
+
+            new_rows = []
+            for row, (include_in_detection, merchant_key, txn_date, cents, merchant_raw) in zip(rows, detection):
+                if row["fingerprint"] in existing:
+                    continue
+
+                new_rows.append(row)
+
+                # Duplicates stay out of detection too (they'd show up as zero-day gaps).
+                if include_in_detection:
+                    charges = by_merchant.get(merchant_key)
+                    if charges is None:
+                        charges = by_merchant[merchant_key] = ChargeColumns()
+                    charges.append(txn_date.toordinal(), cents)
+                    display_names.setdefault(merchant_key, merchant_raw)
+
+            inserted = 0
+            if new_rows:
+                # Inserts run on the session's connection, so they commit (or roll back) together with the
+                # import record. Conflict-ignore covers a concurrent import storing the same rows first.
+                result = db.session.execute(txn_insert, new_rows)
+                inserted = result.rowcount if result.rowcount >= 0 else len(new_rows)
+
+        rows_added += inserted
+        rows_deduplicated += len(rows) - inserted
+
+    def read_chunk() -> list:
+        """Parse rows from the reader until a full insert chunk is pending (or the file ends)."""
+        nonlocal rows_parsed, rows_skipped
+
+        parsed = []
+
+        for row in reader:
+            if not row:
+                continue  # Blank line
+
+            rows_parsed += 1
+
+            # Short rows get empty cells so every planned position exists.
+            if len(row) < width:
+                row += [""] * (width - len(row))
+
+            date_val = row[date_idx] if date_idx is not None else None
+
+            # First non-empty merchant column wins (e.g. Memo, then Description).
+            merchant_raw = ""
+            for idx in merchant_idxs:
+                merchant_raw = row[idx].strip()
+                if merchant_raw:
+                    break
+
+            # Amount handling: prefer a single amount column; otherwise use debit/credit.
+            amt_val = row[amount_idx] if amount_idx is not None else None
+
+            if not date_val or not merchant_raw:
+                rows_skipped += 1
+                continue
+
+            try:
+                txn_date = parse_date(date_val)
+
+                cents = None
+                include_in_detection = True
+
+                if amt_val is not None and amt_val.strip():
+                    cents = _parse_amount_cents(amt_val)
+                else:
+                    debit_cents = _parse_cents(row[debit_idx] if debit_idx is not None else None)
+                    credit_cents = _parse_cents(row[credit_idx] if credit_idx is not None else None)
+
+                    if debit_cents:
+                        cents = abs(debit_cents)
+                    elif credit_cents:
+                        # Credits are saved for completeness, but excluded from recurring *charge* detection
+                        # (avoids treating payroll/deposits/refunds as "subscriptions").
+                        cents = abs(credit_cents)
+                        include_in_detection = False
+                    else:
+                        raise ValueError("Missing amount")
+
+            except Exception:
+                rows_skipped += 1
+                continue
+
+            parsed.append((txn_date, cents, merchant_raw, include_in_detection))
+
+            if len(parsed) >= TXN_INSERT_CHUNK_SIZE:
+                break
+
+        return parsed
+
+    while True:
+        # One chunk at a time, so the phase is closed before each yield: time a streaming
+        # caller spends suspended on the progress event isn't billed to parsing.
+        with phase("parse"):
+            pending = read_chunk()
+
+        if not pending:
+            break
+
+        write_chunk(pending)
+        yield progress("write")
+
+    candidates_created = 0
+    candidates_updated = 0
+
+    # Detection runs over each merchant's persisted history (not just this file) so users who upload
+    # one statement at a time still get candidates. Only merchants present in this file are touched.
+    with phase("history"):
+        affected_keys = list(by_merchant)
+        histories = _load_by_merchant_key(MerchantHistory, user_id, affected_keys)
+
+        # Keep at most one pending candidate per merchant to prevent duplicate review items after multiple imports.
+        # Existing pending candidates for every affected merchant are fetched up front rather than per merchant.
+        pending_candidates = _load_by_merchant_key(
+            RecurringCandidate,
+            user_id,
+            affected_keys,
+            status="pending"
+        )
+
+        # Columnar detection inputs for every affected merchant (one entry per charge in its history window).
+        detect_keys = []
+        detect_names = []
+        charge_idx = array("i")
+        charge_dates = array("i")
+        charge_amounts = array("q")
+
+        for merchant_key, charges in by_merchant.items():
+            history = histories.get(merchant_key)
+            if history is None:
+                history = MerchantHistory(
+                    user_id=user_id,
+                    merchant_key=merchant_key,
+                    charge_count=0,
+                    recent_dates=[],
+                    recent_amounts=[],
+                )
+                db.session.add(history)
+
+            dates, amounts, added = merge_history(
+                history.recent_dates,
+                history.recent_amounts,
+                charges
+            )
+
+            # Assign new lists (not in-place edits) so SQLAlchemy notices the JSON change.
+            history.recent_dates = dates
+            history.recent_amounts = amounts
+            history.charge_count += added
+            history.first_seen = min(history.first_seen or date.max, date.fromordinal(dates[0]))
+            history.last_seen = date.fromordinal(dates[-1])
+            history.median_gap, history.median_amount_cents = summarize_history(dates, amounts)
+
+            idx = len(detect_keys)
+            detect_keys.append(merchant_key)
+            detect_names.append(display_names.get(merchant_key, merchant_key))
+            charge_idx.extend([idx] * len(dates))
+            charge_dates.extend(dates)
+            charge_amounts.extend(amounts)
+
+    # History is merged; tell streaming clients detection is starting.
+    yield progress("history")
+
+    # All merchants are scored in one batched pass (NumPy when available); very large imports
+    # can shard that pass across processes when DETECTION_WORKERS > 1.
+    with phase("detect"):
+        results = detect_recurring_parallel(
+            detect_keys,
+            detect_names,
+            charge_idx,
+            charge_dates,
+            charge_amounts,
+            workers=current_app.config["DETECTION_WORKERS"],
+            min_shard_size=current_app.config["DETECTION_MIN_SHARD_SIZE"]
+        )
+
+    merchants_scored = len(detect_keys)
+    yield progress("detect")
+
+    with phase("upsert"):
+        for result in results:
+            existing = pending_candidates.get(result.merchant_key)
+
+            if existing:
+                existing.display_name = result.display_name[:160]
+                existing.avg_amount = cents_to_decimal(result.avg_amount_cents)
+                existing.cadence_guess = result.cadence_guess
+                existing.confidence = result.confidence
+                existing.last_seen = result.last_seen
+                existing.next_predicted = result.next_predicted
+                candidates_updated += 1
+            else:
+                cand = RecurringCandidate(
+                    user_id=user_id,
+                    merchant_key=result.merchant_key,
+                    display_name=result.display_name[:160],
+                    avg_amount=cents_to_decimal(result.avg_amount_cents),
+                    cadence_guess=result.cadence_guess,
+                    confidence=result.confidence,
+                    last_seen=result.last_seen,
+                    next_predicted=result.next_predicted,
+                    status="pending",
+                )
+                db.session.add(cand)
+                candidates_created += 1
+
+    with phase("commit"):
+        db.session.commit()
+
+    yield {
+        "event": "done",
+        "import": import_record.to_dict(),
+        "rows_added": rows_added,
+        "rows_skipped": rows_skipped,
+        "rows_deduplicated": rows_deduplicated,
+        "candidates_created": candidates_created,
+        "candidates_updated": candidates_updated,
+    }
+
+
+def run_import(user_id: int, filename: str, binary_stream) -> dict:
+    """Run iter_import to completion and return its summary (without the event marker)."""
+    summary = {}
+
+    for event in iter_import(user_id, filename, binary_stream):
+        summary = event
+
+    summary.pop("event", None)
+    return summary
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from .. import db
+from .importer import iter_import
+
+
+# Job states, in the order a job moves through them
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Error recorded on a running job whose worker stopped reporting progress (crash or restart)
+STALE_JOB_ERROR = "Import worker stopped before the job finished."
+
+
+class ImportJobQueue:
+    """
+    Import job queue stored in its own local SQLite file.
+
+    Keeping it out of the main database means progress updates never wait on the
+    import's own write transaction, and every web/worker process on the host sees
+    the same jobs. Each call opens a short-lived connection, so the queue is safe
+    to share between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS import_jobs (
+                    id TEXT PRIMARY KEY,
+                    user_id INTEGER NOT NULL,
+                    filename TEXT NOT NULL,
+                    spool_path TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    rows_parsed INTEGER NOT NULL DEFAULT 0,
+                    rows_written INTEGER NOT NULL DEFAULT 0,
+                    merchants_scored INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    heartbeat_at TEXT
+                )
+                """
+            )
+
+            # Queue files created before heartbeats existed.
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(import_jobs)")}
+            if "heartbeat_at" not in columns:
+                conn.execute("ALTER TABLE import_jobs ADD COLUMN heartbeat_at TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_import_jobs_status_created "
+                "ON import_jobs (status, created_at)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Yield an autocommit connection that is closed afterwards."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, user_id: int, filename: str, spool_path: str) -> str:
+        """Add a queued job and return its id."""
+        job_id = uuid.uuid4().hex
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO import_jobs (id, user_id, filename, spool_path, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, user_id, filename, spool_path, JOB_QUEUED, _now())
+            )
+
+        return job_id
+
+    def claim(self, job_id: str | None = None) -> dict | None:
+        """
+        Atomically move a queued job to running and return it.
+        Claims the given job, or the oldest queued one when job_id is None.
+        """
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE takes the write lock up front so two workers can't claim the same job.
+            conn.execute("BEGIN IMMEDIATE")
+
+            try:
+                if job_id is None:
+                    row = conn.execute(
+                        "SELECT * FROM import_jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                        (JOB_QUEUED,)
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        "SELECT * FROM import_jobs WHERE id = ? AND status = ?",
+                        (job_id, JOB_QUEUED)
+                    ).fetchone()
+
+                if row is not None:
+                    now = _now()
+                    conn.execute(
+                        "UPDATE import_jobs SET status = ?, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                        (JOB_RUNNING, now, now, row["id"])
+                    )
+
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return dict(row) if row is not None else None
+
+    def update_progress(self, job_id: str, rows_parsed: int, rows_written: int, merchants_scored: int) -> None:
+        """Record the latest progress counters for a running job (this doubles as its heartbeat)."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE import_jobs SET rows_parsed = ?, rows_written = ?, merchants_scored = ?, "
+                "heartbeat_at = ? WHERE id = ?",
+                (rows_parsed, rows_written, merchants_scored, _now(), job_id)
+            )
+
+    def finish(self, job_id: str, result: dict) -> None:
+        """Mark a job succeeded and store its import summary."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE import_jobs SET status = ?, result = ?, finished_at = ? WHERE id = ?",
+                (JOB_SUCCEEDED, json.dumps(result), _now(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark a job failed with an error message."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE import_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (JOB_FAILED, error, _now(), job_id)
+            )
+
+    def fail_stale(self, timeout_seconds: float) -> list[str]:
+        """
+        Mark running jobs with no heartbeat for `timeout_seconds` as failed; their worker died
+        or was restarted mid-import. Returns the spool paths of the jobs it failed.
+        """
+        cutoff = _ago(timeout_seconds)
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+
+            try:
+                rows = conn.execute(
+                    "SELECT id, spool_path FROM import_jobs "
+                    "WHERE status = ? AND COALESCE(heartbeat_at, started_at) < ?",
+                    (JOB_RUNNING, cutoff)
+                ).fetchall()
+
+                conn.executemany(
+                    "UPDATE import_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                    [(JOB_FAILED, STALE_JOB_ERROR, _now(), row["id"]) for row in rows]
+                )
+
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return [row["spool_path"] for row in rows]
+
+    def queued_ids(self, older_than_seconds: float = 0) -> list[str]:
+        """Ids of jobs still waiting to be claimed, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM import_jobs WHERE status = ? AND created_at <= ? ORDER BY created_at",
+                (JOB_QUEUED, _ago(older_than_seconds))
+            ).fetchall()
+
+        return [row["id"] for row in rows]
+
+    def count_active(self, user_id: int, within_seconds: float) -> int:
+        """
+        Number of the user's jobs still queued or running that showed signs of life (created,
+        started or reported progress) in the last `within_seconds`; older ones are presumed
+        orphaned until the stale-job sweep fails them.
+        """
+        with self._connect() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM import_jobs WHERE status IN (?, ?) AND user_id = ? "
+                "AND COALESCE(heartbeat_at, started_at, created_at) >= ?",
+                (JOB_QUEUED, JOB_RUNNING, user_id, _ago(within_seconds))
+            ).fetchone()
+
+        return count
+
+    def get(self, job_id: str, user_id: int) -> dict | None:
+        """Return a job's public fields if it belongs to user_id."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM import_jobs WHERE id = ? AND user_id = ?",
+                (job_id, user_id)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            "id": row["id"],
+            "filename": row["filename"],
+            "status": row["status"],
+            "rows_parsed": row["rows_parsed"],
+            "rows_written": row["rows_written"],
+            "merchants_scored": row["merchants_scored"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _ago(seconds: float) -> str:
+    return (datetime.utcnow() - timedelta(seconds=seconds)).isoformat()
+
+
+def _remove_spool(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def run_job(app, queue: ImportJobQueue, job: dict) -> None:
+    """Run a claimed job inside its own app context, recording progress and outcome."""
+    with app.app_context():
+        try:
+            with open(job["spool_path"], "rb") as fh:
+                for event in iter_import(job["user_id"], job["filename"], fh):
+                    if event["event"] == "progress":
+                        queue.update_progress(
+                            job["id"],
+                            event["rows_parsed"],
+                            event["rows_written"],
+                            event["merchants_scored"]
+                        )
+                    else:
+                        event.pop("event")
+                        queue.finish(job["id"], event)
+        except Exception as e:
+            db.session.rollback()
+            app.logger.exception("Import job %s failed", job["id"])
+            queue.fail(job["id"], str(e) or e.__class__.__name__)
+        finally:
+            _remove_spool(job["spool_path"])
+
+
+class ImportJobRunner:
+    """
+    Queue plus (optionally) an in-process thread pool that runs jobs as soon as they're enqueued.
+
+    In "thread" mode a sweeper thread also recovers jobs orphaned by a crash or restart:
+    running jobs without a heartbeat for IMPORT_STALE_JOB_SECONDS are failed (and their
+    spool files removed), and queued jobs nobody picked up are submitted here. The first
+    sweep runs at startup and submits every queued job.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.queue = ImportJobQueue(app.config["IMPORT_QUEUE_PATH"])
+        self.spool_dir = app.config["IMPORT_SPOOL_DIR"]
+        self.stale_seconds = app.config["IMPORT_STALE_JOB_SECONDS"]
+
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+        # In "external" mode jobs wait in the queue for `python worker.py` to pick them up.
+        self.executor = None
+        self._submitted = set()  # job ids handed to the executor and not yet run
+        self._lock = threading.Lock()
+
+        if app.config["IMPORT_WORKER_MODE"] == "thread":
+            self.executor = ThreadPoolExecutor(
+                max_workers=app.config["IMPORT_WORKERS"],
+                thread_name_prefix="import-job"
+            )
+
+            self.recover(queued_older_than=0)
+
+            sweeper = threading.Thread(
+                target=self._sweep_forever,
+                args=(app.config["IMPORT_SWEEP_SECONDS"],),
+                name="import-job-sweeper",
+                daemon=True
+            )
+            sweeper.start()
+
+    def recover(self, queued_older_than: float | None = None) -> None:
+        """
+        Fail stale running jobs and, with an executor, submit queued jobs at least
+        `queued_older_than` seconds old (default: the stale timeout).
+        """
+        for spool_path in self.queue.fail_stale(self.stale_seconds):
+            _remove_spool(spool_path)
+
+        if self.executor is None:
+            return
+
+        if queued_older_than is None:
+            queued_older_than = self.stale_seconds
+
+        for job_id in self.queue.queued_ids(queued_older_than):
+            self._schedule(job_id)
+
+    def _sweep_forever(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                self.recover()
+            except Exception:
+                self.app.logger.exception("Import job sweep failed")
+
+    def _schedule(self, job_id: str) -> None:
+        with self._lock:
+            if job_id in self._submitted:
+                return
+            self._submitted.add(job_id)
+
+        self.executor.submit(self._run, job_id)
+
+    def submit(self, user_id: int, file_storage) -> str:
+        """Spool an uploaded file to disk, enqueue a job for it and return the job id."""
+        spool_path = os.path.join(self.spool_dir, f"{uuid.uuid4().hex}.csv")
+        file_storage.save(spool_path)
+
+        job_id = self.queue.enqueue(user_id, file_storage.filename, spool_path)
+
+        if self.executor is not None:
+            self._schedule(job_id)
+
+        return job_id
+
+    def _run(self, job_id: str) -> None:
+        try:
+            # claim() is atomic, so a job another process already took is skipped here.
+            job = self.queue.claim(job_id)
+            if job is not None:
+                run_job(self.app, self.queue, job)
+        finally:
+            with self._lock:
+                self._submitted.discard(job_id)
+
+
+def init_import_jobs(app) -> None:
+    """Attach the import job runner to the app (available as app.extensions["import_jobs"])."""
+    app.extensions["import_jobs"] = ImportJobRunner(app)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider, _default as _flask_default
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; responses fall back to the stdlib encoder.
+    orjson = None
+
+
+def _default(value):
+    """
+    Types neither encoder handles on its own, converted the way the models' to_dict() did:
+    Decimal -> float, date/datetime -> ISO 8601 (orjson already writes those natively).
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return _flask_default(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson when it's installed (and enabled), else
+    the stdlib, so views can return rows holding date/datetime/Decimal values as they
+    come out of the database.
+
+    Output is the same JSON as the stdlib provider's (sorted keys, compact responses,
+    indented in debug mode) but not always the same bytes: orjson writes non-ASCII text as
+    raw UTF-8 ("Café") where the stdlib escapes it ("Caf\\u00e9"), and dumps() is compact
+    where the stdlib puts a space after ":" and ",". Both decode to the same value and
+    responses are UTF-8 either way, so those differences are accepted. Anything
+    orjson refuses, e.g. integers wider than 64 bits, is retried with the stdlib encoder;
+    calls with json.dumps-specific keyword arguments go straight to it.
+    """
+
+    default = staticmethod(_default)
+
+    def __init__(self, app, use_orjson: bool = True):
+        super().__init__(app)
+        self.use_orjson = use_orjson and orjson is not None
+
+    def _orjson_option(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if self.use_orjson and not kwargs:
+            try:
+                return orjson.dumps(obj, default=_default, option=self._orjson_option()).decode()
+            except TypeError:
+                pass
+
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if not self.use_orjson:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+
+        try:
+            data = orjson.dumps(obj, default=_default, option=self._orjson_option(indent))
+        except TypeError:
+            return super().response(*args, **kwargs)
+
+        # Bytes go straight into the response; no str round trip.
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
+
+
+def init_json_provider(app) -> None:
+    """Install FastJSONProvider as app.json; JSON_BACKEND="stdlib" keeps the stdlib encoder."""
+    app.json = FastJSONProvider(app, use_orjson=app.config["JSON_BACKEND"] != "stdlib")
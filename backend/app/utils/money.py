@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+
+# Transaction amounts and detection work in integer cents; these convert at the edges
+# (Numeric columns, request filters) without going through float.
+CENT = Decimal("0.01")
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Exact two-place Decimal for an integer number of cents."""
+    return Decimal(cents).scaleb(-2).quantize(CENT)
+
+
+def decimal_to_cents(value: Decimal, rounding: str = ROUND_HALF_EVEN) -> int:
+    """Integer cents for a Decimal amount, rounding sub-cent values with `rounding`."""
+    return int((value * 100).to_integral_value(rounding=rounding))
@@ -6,32 +6,94 @@
 # Version: 0.1.0
 
 import re
+from functools import lru_cache
 
 
-def normalize_merchant(raw: str) -> str:
+# Bank exports repeat the same merchant strings thousands of times, so results are memoized.
+# Bounded so a file full of unique strings can't grow the cache without limit.
+NORMALIZE_CACHE_SIZE = 65536
+
+# Long standalone numbers (often store IDs)
+_LONG_NUMBER_RE = re.compile(r"\b\d{2,}\b")
+
+
+class _PunctuationTable(dict):
     """
-    Normalize a merchant string for grouping transactions.
-    Converts text to uppercase, removes punctuation,
-    strips long numeric tokens, and collapses whitespace.
+    str.translate table that keeps A-Z, 0-9 and whitespace and maps everything else to a space.
+    Entries are filled in lazily the first time a code point is seen.
     """
 
-    if not raw:
-        return "UNKNOWN"
+    def __missing__(self, codepoint: int):
+        ch = chr(codepoint)
+        keep = ("A" <= ch <= "Z") or ("0" <= ch <= "9") or ch.isspace()
+
+        value = codepoint if keep else " "
+        self[codepoint] = value
+        return value
+
+
+_PUNCTUATION_TABLE = _PunctuationTable()
+
+
+def _normalize(raw: str) -> str:
+    """Uncached normalization; see normalize_merchant()."""
 
     # Convert to uppercase
     text = raw.upper()
 
-    # Replace punctuation with spaces
-    text = re.sub(r"[^A-Z0-9\s]", " ", text)
+    # Replace punctuation with spaces (single pass, no regex)
+    text = text.translate(_PUNCTUATION_TABLE)
 
     # Remove long standalone numbers (often store IDs)
-    text = re.sub(r"\b\d{2,}\b", " ", text)
+    text = _LONG_NUMBER_RE.sub(" ", text)
 
     # Collapse multiple spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
 
     if not text:
         return "UNKNOWN"
 
     # Limit stored length
     return text[:160]
+
+
+_normalize_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_normalize)
+
+
+def normalize_merchant(raw: str) -> str:
+    """
+    Normalize a merchant string for grouping transactions.
+    Converts text to uppercase, removes punctuation,
+    strips long numeric tokens, and collapses whitespace.
+    """
+
+    if not raw:
+        return "UNKNOWN"
+
+    return _normalize_cached(raw)
+
+
+def normalize_merchant_prefix(raw: str) -> str:
+    """
+    Fold a search prefix the way normalize_merchant folds keys (uppercase, punctuation to
+    spaces, collapsed whitespace) without the key-only rules: numbers are kept and empty
+    input stays empty instead of becoming "UNKNOWN", so "12" still means "starts with 12".
+    """
+    return " ".join(raw.upper().translate(_PUNCTUATION_TABLE).split())[:160]
+
+
+def normalize_many(raws) -> list[str]:
+    """Normalize an iterable of merchant strings, returning keys in the same order."""
+    return [normalize_merchant(raw) for raw in raws]
+
+
+def normalize_cache_info() -> dict:
+    """Return hit/miss counters for the merchant normalization cache."""
+    info = _normalize_cached.cache_info()
+
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import tuple_
+
+from .. import db
+
+
+# Largest page a client can ask for with ?limit=
+MAX_PAGE_LIMIT = 500
+
+
+def parse_limit(value) -> int | None:
+    """
+    Parse the ?limit= query parameter.
+    Returns None when absent (unpaginated), raises ValueError if invalid.
+    """
+    if value is None or value == "":
+        return None
+
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("Limit must be an integer.")
+
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"Limit must be between 1 and {MAX_PAGE_LIMIT}.")
+
+    return limit
+
+
+def parse_fields(value, model) -> list[str] | None:
+    """
+    Parse a comma-separated ?fields= list against the model's mapped columns
+    (including SQL-derived ones). Returns None when absent (full objects), raises
+    ValueError on unknown fields.
+    """
+    if not value:
+        return None
+
+    columns = model.__mapper__.column_attrs
+    fields = list(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+
+    unknown = [f for f in fields if f not in columns]
+    if unknown or not fields:
+        raise ValueError(f"Fields must be from: {sorted(columns.keys())}")
+
+    return fields
+
+
+def encode_cursor(values) -> str:
+    """Opaque, URL-safe cursor for the sort key of the last row on a page."""
+    raw = json.dumps([_json_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value, parsers) -> tuple | None:
+    """
+    Decode a cursor produced by encode_cursor(), converting each part with `parsers`.
+    Returns None when absent, raises ValueError if malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        parts = json.loads(raw)
+
+        if not isinstance(parts, list) or len(parts) != len(parsers):
+            raise ValueError
+
+        return tuple(parse(part) for parse, part in zip(parsers, parts))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor.")
+
+
+def _json_value(value):
+    """Cursor value -> JSON value, matching the models' to_dict() conversions."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def fetch_page(model, criteria, sort_keys, args, default_limit=None) -> tuple[list[dict], str | None]:
+    """
+    Run a per-user list query with optional keyset pagination and field projection.
+
+    criteria:  filter expressions (e.g. user_id/status)
+    sort_keys: ((column_name, cursor_parser), ...) sorted descending; the last one must be unique
+    args:      request.args (limit, cursor, fields)
+    default_limit: page size when ?limit= is absent (None returns every row)
+
+    Rows after the ?cursor= position are read straight off the matching index, so every
+    page costs the same no matter how deep it is. Only the requested ?fields= (or the
+    model's JSON_FIELDS) are selected, as plain rows: no ORM instances or to_dict() calls,
+    and date/Decimal values are left for the app's JSON provider to encode. Returns
+    (items, next_cursor); next_cursor is None on the last page. Raises ValueError for
+    bad parameters.
+    """
+    limit = parse_limit(args.get("limit"))
+    if limit is None:
+        limit = default_limit
+    after = decode_cursor(args.get("cursor"), [parse for _, parse in sort_keys])
+    fields = parse_fields(args.get("fields"), model) or list(model.JSON_FIELDS)
+
+    sort_columns = [getattr(model, name) for name, _ in sort_keys]
+
+    # Sort columns ride along (after the fields) so the next cursor can be built even if not requested.
+    selected = list(dict.fromkeys(fields + [name for name, _ in sort_keys]))
+    query = db.session.query(*[getattr(model, name) for name in selected]).filter(*criteria)
+
+    if after is not None:
+        query = query.filter(tuple_(*sort_columns) < tuple_(*after))
+
+    query = query.order_by(*[c.desc() for c in sort_columns])
+
+    if limit is not None:
+        # One extra row tells us whether another page exists.
+        query = query.limit(limit + 1)
+
+    rows = query.all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], name) for name, _ in sort_keys])
+
+    # zip() stops at the requested fields, dropping any sort columns that only rode along.
+    items = [dict(zip(fields, row)) for row in rows]
+
+    return items, next_cursor
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from flask import current_app, has_app_context
+
+
+# bcrypt's own default work factor (~250 ms per hash on typical hardware)
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+class PasswordHasherBusy(Exception):
+    """Every hashing worker is busy and the wait queue is full; callers answer 503."""
+
+
+def _hashpw(raw: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(raw, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(raw: bytes, hashed: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(raw, hashed)
+    except Exception:
+        return False
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool with bounded admission.
+
+    bcrypt releases the GIL, so at most `workers` hashes burn CPU at once no matter how
+    many login requests arrive; up to `queue_depth` more wait their turn and anything
+    beyond that is rejected immediately with PasswordHasherBusy instead of piling up
+    behind the pool. With workers=0 hashing runs inline on the request thread.
+    """
+
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS, workers: int = 0, queue_depth: int = 0):
+        self.rounds = rounds
+        self.executor = None
+        self._slots = None
+        self._dummy_hash = None
+        self._dummy_lock = threading.Lock()
+
+        if workers > 0:
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+            self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    def _run(self, fn, *args):
+        if self.executor is None:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy()
+
+        try:
+            return self.executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, raw_password: str) -> bytes:
+        return self._run(_hashpw, raw_password.encode("utf-8"), self.rounds)
+
+    def verify(self, raw_password: str, hashed: bytes) -> bool:
+        return self._run(_checkpw, raw_password.encode("utf-8"), hashed)
+
+    def prepare_dummy(self) -> bytes:
+        """Build (once) the throwaway hash verify_dummy() checks against; init_password_hasher calls it at startup."""
+        if self._dummy_hash is None:
+            with self._dummy_lock:
+                if self._dummy_hash is None:
+                    self._dummy_hash = _hashpw(b"dummy-password-for-unknown-accounts", self.rounds)
+
+        return self._dummy_hash
+
+    def verify_dummy(self, raw_password: str) -> None:
+        """
+        Spend exactly what a real verify() costs (same rounds, same pool) against a throwaway
+        hash, so a login for an unknown account takes as long as a wrong password.
+        """
+        self._run(_checkpw, raw_password.encode("utf-8"), self.prepare_dummy())
+
+
+# Used outside an app (scripts, shell) or before init_password_hasher ran: inline, default cost.
+_inline_hasher = PasswordHasher()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """The current app's hasher, or an inline one when there is no app context."""
+    if has_app_context():
+        return current_app.extensions.get("password_hasher", _inline_hasher)
+    return _inline_hasher
+
+
+def init_password_hasher(app) -> None:
+    """
+    Create the app's bcrypt pool from BCRYPT_ROUNDS / BCRYPT_WORKERS / BCRYPT_QUEUE_DEPTH.
+    The dummy hash is built here, so no login ever computes it on the request thread.
+    """
+    hasher = PasswordHasher(
+        rounds=app.config["BCRYPT_ROUNDS"],
+        workers=app.config["BCRYPT_WORKERS"],
+        queue_depth=app.config["BCRYPT_QUEUE_DEPTH"]
+    )
+    hasher.prepare_dummy()
+
+    app.extensions["password_hasher"] = hasher
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import hmac
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from flask import Response, g, has_app_context, jsonify, request
+from sqlalchemy import event
+
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prefix for every exported metric name
+METRIC_PREFIX = "subanalyzer"
+
+
+class RequestProfile:
+    """
+    Timings collected for one request.
+
+    Phases record *self* time: when phases nest, the inner phase's time is not also
+    counted in the outer one, so the per-phase numbers add up to (at most) the total.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.peak_bytes = None
+        self._stack = []
+
+    def enter(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        name, started, nested = self._stack.pop()
+        elapsed = time.perf_counter() - started
+
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+
+def _current_profile() -> RequestProfile | None:
+    """The active request's profile, or None (profiling off, or outside a profiled request)."""
+    if not has_app_context():
+        return None
+    return g.get("_profile")
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Attribute the wrapped block's wall time to a named phase of the current request.
+    Costs one lookup when profiling is off, so it can stay in place permanently.
+    """
+    profile = _current_profile()
+
+    if profile is None:
+        yield
+        return
+
+    profile.enter(name)
+    try:
+        yield
+    finally:
+        profile.exit()
+
+
+class MetricsRegistry:
+    """Process-local aggregates of request profiles, rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}       # endpoint -> [count, seconds, bucket counts...]
+        self.phases = {}         # (endpoint, phase) -> seconds
+        self.sql = {}            # endpoint -> [statements, seconds]
+        self.peak_bytes = {}     # endpoint -> largest peak seen
+        self.collectors = []     # callables(prefix) -> extra exposition lines (e.g. cache stats)
+
+    def add_collector(self, collect) -> None:
+        """Append another component's metrics to the /api/_metrics output."""
+        self.collectors.append(collect)
+
+    def record(self, endpoint: str, profile: RequestProfile, duration: float) -> None:
+        with self._lock:
+            stats = self.requests.setdefault(endpoint, [0, 0.0] + [0] * len(DURATION_BUCKETS))
+            stats[0] += 1
+            stats[1] += duration
+
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    stats[2 + i] += 1
+
+            for name, seconds in profile.phases.items():
+                key = (endpoint, name)
+                self.phases[key] = self.phases.get(key, 0.0) + seconds
+
+            sql = self.sql.setdefault(endpoint, [0, 0.0])
+            sql[0] += profile.sql_count
+            sql[1] += profile.sql_seconds
+
+            if profile.peak_bytes is not None:
+                self.peak_bytes[endpoint] = max(self.peak_bytes.get(endpoint, 0), profile.peak_bytes)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        p = METRIC_PREFIX
+        lines = []
+
+        with self._lock:
+            lines += [
+                f"# HELP {p}_request_duration_seconds Wall time of profiled requests.",
+                f"# TYPE {p}_request_duration_seconds histogram",
+            ]
+            for endpoint, stats in sorted(self.requests.items()):
+                label = f'endpoint="{endpoint}"'
+                for i, bound in enumerate(DURATION_BUCKETS):
+                    lines.append(f'{p}_request_duration_seconds_bucket{{{label},le="{bound}"}} {stats[2 + i]}')
+                lines.append(f'{p}_request_duration_seconds_bucket{{{label},le="+Inf"}} {stats[0]}')
+                lines.append(f"{p}_request_duration_seconds_sum{{{label}}} {stats[1]:.6f}")
+                lines.append(f"{p}_request_duration_seconds_count{{{label}}} {stats[0]}")
+
+            lines += [
+                f"# HELP {p}_phase_seconds_total Self time spent in named request phases.",
+                f"# TYPE {p}_phase_seconds_total counter",
+            ]
+            for (endpoint, name), seconds in sorted(self.phases.items()):
+                lines.append(f'{p}_phase_seconds_total{{endpoint="{endpoint}",phase="{name}"}} {seconds:.6f}')
+
+            lines += [
+                f"# HELP {p}_sql_statements_total SQL statements executed by profiled requests.",
+                f"# TYPE {p}_sql_statements_total counter",
+            ]
+            for endpoint, (count, _) in sorted(self.sql.items()):
+                lines.append(f'{p}_sql_statements_total{{endpoint="{endpoint}"}} {count}')
+
+            lines += [
+                f"# HELP {p}_sql_seconds_total Time spent executing SQL in profiled requests.",
+                f"# TYPE {p}_sql_seconds_total counter",
+            ]
+            for endpoint, (_, seconds) in sorted(self.sql.items()):
+                lines.append(f'{p}_sql_seconds_total{{endpoint="{endpoint}"}} {seconds:.6f}')
+
+            if self.peak_bytes:
+                lines += [
+                    f"# HELP {p}_peak_traced_bytes Largest tracemalloc peak seen during a request.",
+                    f"# TYPE {p}_peak_traced_bytes gauge",
+                ]
+                for endpoint, peak in sorted(self.peak_bytes.items()):
+                    lines.append(f'{p}_peak_traced_bytes{{endpoint="{endpoint}"}} {peak}')
+
+        for collect in self.collectors:
+            lines += collect(p)
+
+        return "\n".join(lines) + "\n"
+
+
+def server_timing(profile: RequestProfile, duration: float) -> str:
+    """Format a profile as a Server-Timing header value (durations in milliseconds)."""
+    entries = [f"total;dur={duration * 1000:.2f}"]
+
+    for name, seconds in profile.phases.items():
+        entries.append(f"{name};dur={seconds * 1000:.2f}")
+
+    entries.append(f'sql;dur={profile.sql_seconds * 1000:.2f};desc="{profile.sql_count} statements"')
+
+    if profile.peak_bytes is not None:
+        entries.append(f'mem;desc="peak {profile.peak_bytes / 1048576:.1f} MiB"')
+
+    return ", ".join(entries)
+
+
+def _register_sql_events(engine) -> None:
+    """Count and time every cursor execution that happens inside a profiled request."""
+
+    # The start time lives on the statement's execution context, which is discarded with the
+    # statement, so executions that raise (no after_cursor_execute) leave nothing behind.
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profile_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = _current_profile()
+        started = getattr(context, "_profile_start", None)
+
+        if profile is not None:
+            profile.sql_count += 1
+            if started is not None:
+                profile.sql_seconds += time.perf_counter() - started
+
+
+def init_profiling(app, db) -> None:
+    """
+    Opt-in request instrumentation (PROFILING_ENABLED=1).
+
+    Adds a Server-Timing header to every non-streamed response and, when METRICS_TOKEN is
+    set, serves aggregated numbers to holders of that token at /api/_metrics in Prometheus
+    text format. With PROFILING_TRACE_MEMORY=1 tracemalloc
+    also runs and each request reports its peak; that slows allocation-heavy code
+    noticeably and peaks overlap when requests run concurrently, so keep it for
+    investigation rather than production. Metrics are per process.
+    """
+    if not app.config["PROFILING_ENABLED"]:
+        return
+
+    registry = MetricsRegistry()
+    app.extensions["profiling"] = registry
+    trace_memory = app.config["PROFILING_TRACE_MEMORY"]
+
+    with app.app_context():
+        _register_sql_events(db.engine)
+
+    @app.before_request
+    def start_profile():
+        g._profile = RequestProfile()
+
+        if trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+    def finish(profile: RequestProfile, endpoint: str) -> float:
+        duration = time.perf_counter() - profile.started
+
+        if trace_memory and tracemalloc.is_tracing():
+            profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+        registry.record(endpoint, profile, duration)
+        return duration
+
+    @app.after_request
+    def finish_profile(response):
+        profile = g.get("_profile")
+        if profile is None:
+            return response
+
+        endpoint = request.endpoint or "unmatched"
+
+        # A streamed body runs after this hook: leave the profile on g so its phases and SQL
+        # still count, and record once the body is sent (headers are gone by then, so no
+        # Server-Timing for these).
+        if response.is_streamed:
+            response.call_on_close(lambda: finish(profile, endpoint))
+            return response
+
+        g.pop("_profile")
+        response.headers["Server-Timing"] = server_timing(profile, finish(profile, endpoint))
+
+        return response
+
+    # Latency, SQL counts and cache sizes aren't for everyone: no token, no endpoint.
+    token = app.config["METRICS_TOKEN"]
+    if not token:
+        return
+
+    @app.get("/api/_metrics")
+    def metrics():
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return jsonify({"error": "Invalid metrics token."}), 401
+
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
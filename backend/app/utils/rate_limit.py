@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, jsonify
+
+
+# Seconds per unit accepted in rate strings like "10/minute"
+RATE_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# The in-memory store forgets idle (refilled) buckets once it tracks this many keys
+MEMORY_MAX_KEYS = 100_000
+
+# The SQLite store deletes refilled buckets once every this many takes (per process)
+SQLITE_SWEEP_EVERY = 1000
+
+
+def parse_rate(value: str) -> tuple[int, float]:
+    """
+    Parse "<count>/<period>" (e.g. "10/minute") into (burst capacity, tokens per second).
+    The bucket holds `count` tokens and refills the whole amount once per period.
+    """
+    count, _, period = value.strip().lower().partition("/")
+
+    if period not in RATE_PERIODS or not count.isdigit() or int(count) < 1:
+        raise ValueError(f"Invalid rate {value!r}; expected e.g. '10/minute'.")
+
+    capacity = int(count)
+    return capacity, capacity / RATE_PERIODS[period]
+
+
+def _take_token(tokens: float, updated_at: float, now: float, capacity: int, refill: float):
+    """
+    Token-bucket step: refill for the time elapsed since updated_at, then try to take one token.
+    Returns (tokens left, allowed, seconds until the next token when refused).
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill)
+
+    if tokens >= 1:
+        return tokens - 1, True, 0.0
+
+    return tokens, False, (1 - tokens) / refill
+
+
+class MemoryLimitStore:
+    """Buckets and concurrency leases held in this process (one web worker, or tests)."""
+
+    def __init__(self):
+        self._buckets = {}  # key -> (tokens, updated_at, capacity, refill)
+        self._leases = {}   # key -> {lease_id: expires_at}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, refill: float) -> tuple[bool, float]:
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated_at, _, _ = self._buckets.get(key, (capacity, now, capacity, refill))
+            tokens, allowed, retry_after = _take_token(tokens, updated_at, now, capacity, refill)
+            self._buckets[key] = (tokens, now, capacity, refill)
+
+            if len(self._buckets) > MEMORY_MAX_KEYS:
+                self._forget_full_buckets(now)
+
+        return allowed, retry_after
+
+    def _forget_full_buckets(self, now: float) -> None:
+        # A bucket that has refilled completely behaves exactly like a missing one.
+        for key, (tokens, updated_at, capacity, refill) in list(self._buckets.items()):
+            if tokens + (now - updated_at) * refill >= capacity:
+                del self._buckets[key]
+
+    def acquire(self, key: str, limit: int, held: int, ttl: float) -> str | None:
+        now = time.monotonic()
+
+        with self._lock:
+            leases = {k: expires_at for k, expires_at in self._leases.get(key, {}).items() if expires_at > now}
+
+            if len(leases) + held >= limit:
+                return None
+
+            lease_id = uuid.uuid4().hex
+            leases[lease_id] = now + ttl
+            self._leases[key] = leases
+
+        return lease_id
+
+    def release(self, key: str, lease_id: str) -> None:
+        with self._lock:
+            leases = self._leases.get(key)
+            if leases is not None:
+                leases.pop(lease_id, None)
+                if not leases:
+                    del self._leases[key]
+
+
+class SqliteLimitStore:
+    """
+    Buckets and leases in a local SQLite file, so limits hold across every gunicorn worker
+    on the host. Same approach as the import job queue: short-lived autocommit connections,
+    BEGIN IMMEDIATE around each read-modify-write. Leases expire after their TTL so a
+    worker that dies mid-import can't hold a user's slot forever, and buckets that have
+    refilled are swept now and then so the table only holds recently active keys.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._takes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_buckets (
+                    key TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    full_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_rate_buckets_full_at ON rate_buckets (full_at)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS concurrency_leases (
+                    id TEXT PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_concurrency_leases_key_expires "
+                "ON concurrency_leases (key, expires_at)"
+            )
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a connection holding the write lock; commits on success, rolls back on error."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def take(self, key: str, capacity: int, refill: float) -> tuple[bool, float]:
+        # Wall clock, not monotonic: the timestamps are compared across processes.
+        now = time.time()
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_buckets WHERE key = ?", (key,)
+            ).fetchone()
+
+            tokens, updated_at = row if row is not None else (capacity, now)
+            tokens, allowed, retry_after = _take_token(tokens, updated_at, now, capacity, refill)
+
+            conn.execute(
+                "INSERT INTO rate_buckets (key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET tokens = excluded.tokens, "
+                "updated_at = excluded.updated_at, full_at = excluded.full_at",
+                (key, tokens, now, now + (capacity - tokens) / refill)
+            )
+
+            self._takes += 1
+            if self._takes % SQLITE_SWEEP_EVERY == 0:
+                conn.execute("DELETE FROM rate_buckets WHERE full_at <= ?", (now,))
+
+        return allowed, retry_after
+
+    def acquire(self, key: str, limit: int, held: int, ttl: float) -> str | None:
+        now = time.time()
+
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM concurrency_leases WHERE key = ? AND expires_at <= ?", (key, now))
+
+            (active,) = conn.execute(
+                "SELECT COUNT(*) FROM concurrency_leases WHERE key = ?", (key,)
+            ).fetchone()
+
+            if active + held >= limit:
+                return None
+
+            lease_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO concurrency_leases (id, key, expires_at) VALUES (?, ?, ?)",
+                (lease_id, key, now + ttl)
+            )
+
+        return lease_id
+
+    def release(self, key: str, lease_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM concurrency_leases WHERE id = ?", (lease_id,))
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets keyed by user or client, plus per-user concurrency leases.
+
+    `limits` maps an endpoint name to (capacity, tokens per second); endpoints without an
+    entry are not limited. Which store backs it decides whether limits are per process
+    (memory) or shared by all workers on the host (sqlite).
+    """
+
+    def __init__(self, store, limits: dict):
+        self.store = store
+        self.limits = limits
+
+    def hit(self, endpoint: str, key) -> tuple[bool, float]:
+        """Spend one token of `key`'s bucket for `endpoint`; returns (allowed, retry after seconds)."""
+        limit = self.limits.get(endpoint)
+        if limit is None:
+            return True, 0.0
+
+        capacity, refill = limit
+        return self.store.take(f"{endpoint}:{key}", capacity, refill)
+
+    def acquire(self, name: str, key, limit: int, held: int = 0, ttl: float = 3600) -> str | None:
+        """
+        Take one of `limit` concurrent slots for `key` (`held` counts slots used elsewhere, e.g.
+        queued jobs). Returns a lease id to pass to release(), or None when all are in use.
+        """
+        return self.store.acquire(f"{name}:{key}", limit, held, ttl)
+
+    def release(self, name: str, key, lease_id: str) -> None:
+        self.store.release(f"{name}:{key}", lease_id)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The current app's limiter (with no rate limits when RATE_LIMIT_ENABLED is off)."""
+    return current_app.extensions["rate_limiter"]
+
+
+def too_many_requests(message: str, retry_after: float):
+    """429 with a Retry-After (whole seconds, at least 1) clients can back off by."""
+    return jsonify({"error": message}), 429, {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+def rate_limited(endpoint: str, key_func):
+    """
+    Refuse the request with 429 once key_func()'s bucket for `endpoint` is empty.
+    Place it below @jwt_required() when key_func reads the JWT identity.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            allowed, retry_after = get_rate_limiter().hit(endpoint, key_func())
+            if not allowed:
+                return too_many_requests("Too many requests. Please slow down.", retry_after)
+
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def init_rate_limiter(app) -> None:
+    """
+    Build the app's limiter from the RATE_LIMIT_* settings. It's built even when rate limits
+    are disabled, just without any, because its store also holds the concurrency leases
+    behind MAX_CONCURRENT_IMPORTS.
+    """
+    backend = app.config["RATE_LIMIT_BACKEND"]
+
+    if backend == "memory":
+        store = MemoryLimitStore()
+    elif backend == "sqlite":
+        store = SqliteLimitStore(app.config["RATE_LIMIT_SQLITE_PATH"])
+    else:
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND {backend!r}; use 'memory' or 'sqlite'.")
+
+    limits = {}
+    if app.config["RATE_LIMIT_ENABLED"]:
+        limits = {
+            "login": parse_rate(app.config["RATE_LIMIT_LOGIN"]),
+            "login-ip": parse_rate(app.config["RATE_LIMIT_LOGIN_IP"]),
+            "imports": parse_rate(app.config["RATE_LIMIT_IMPORTS"]),
+        }
+
+    app.extensions["rate_limiter"] = RateLimiter(store, limits)
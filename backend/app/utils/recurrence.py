@@ -5,11 +5,63 @@
 # Date: February 5th 2026
 # Version: 0.1.0
 
+import heapq
+import multiprocessing
+import re
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, timedelta
-from decimal import Decimal
 from statistics import median
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; detect_recurring_batch falls back to the scalar detector.
+    np = None
+
+
+# How many of a merchant's most recent charges are kept in persisted history.
+# 24 covers two years of monthly billing, which is plenty for cadence + amount signals.
+HISTORY_WINDOW = 24
+
+# Known cadence targets and tolerance ranges, checked in order.
+# Monthly is intentionally wider because real billing varies (28-35 days).
+CADENCE_BUCKETS = (
+    ("weekly", 7, 2),
+    ("monthly", 30, 7),
+    ("quarterly", 91, 12),
+    ("yearly", 365, 25),
+)
+
+# Relative distance from the median amount that still counts as "the same charge".
+AMOUNT_TOLERANCE_RATIO = 0.12
+
+# Curated keyword lists: keep these tight and biased toward high-signal terms.
+# (The goal is to nudge borderline cases, not to "detect" subscriptions purely by keywords.)
+BOOST_KEYWORDS = [
+    "netflix", "hulu", "spotify", "pandora", "apple", "icloud", "itunes", "app store",
+    "max", "hbomax", "disney", "prime", "amazon prime", "youtube", "yt premium",
+    "spectrum", "comcast", "xfinity", "verizon", "att", "tmobile", "internet",
+    "electric", "energy", "water", "utility", "sewer", "gas",
+    "insurance", "premium", "geico", "progressive", "state farm",
+    "membership", "subscription", "billing", "recurring",
+    "loan", "car payment", "lease",
+    "capital one", "discover", "chase", "credit one", "amex",
+]
+
+PENALTY_KEYWORDS = [
+    "doordash", "uber", "ubereats", "grubhub",
+    "mcdonald", "wendy", "taco", "domino", "pizza", "kfc", "burger", "chipotle", "papa", "subway", "sonic",
+    "restaurant", "grill", "cafe", "bar", "steakhouse",
+    "meijer", "walmart", "target", "marathon", "shell", "bp",
+    "service fee", "transfer", "fee"
+]
+
+# Substring matching against every keyword at once (same result as any(k in text for k in ...)).
+_BOOST_RE = re.compile("|".join(map(re.escape, BOOST_KEYWORDS)))
+_PENALTY_RE = re.compile("|".join(map(re.escape, PENALTY_KEYWORDS)))
+
 
 @dataclass
 class CandidateResult:
@@ -17,13 +69,39 @@ class CandidateResult:
 
     merchant_key: str
     display_name: str
-    avg_amount: float
+    avg_amount_cents: int
     cadence_guess: str
     confidence: float
     last_seen: date
     next_predicted: date
 
 
+class ChargeColumns:
+    """
+    Append-only (date, amount) charges for one merchant, stored column-wise.
+
+    Date ordinals live in an array('i') and cents in an array('q'): 12 bytes per charge,
+    versus a tuple, a date and an int object each in a list of tuples. Iterating yields
+    (ordinal, cents) pairs; NumPy can read either array through the buffer protocol.
+    """
+
+    __slots__ = ("ordinals", "cents")
+
+    def __init__(self):
+        self.ordinals = array("i")
+        self.cents = array("q")
+
+    def append(self, ordinal: int, cents: int) -> None:
+        self.ordinals.append(ordinal)
+        self.cents.append(cents)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __iter__(self):
+        return zip(self.ordinals, self.cents)
+
+
 def _cadence_from_gaps(gaps: list[int]) -> tuple[str | None, float]:
     """
     Estimate billing cadence from time gaps between charges.
@@ -36,16 +114,7 @@ def _cadence_from_gaps(gaps: list[int]) -> tuple[str | None, float]:
     # Median is more robust than mean when one-off delays happen (holidays, weekends, processing lag).
     med = median(gaps)
 
-    # Known cadence targets and tolerance ranges.
-    # Monthly is intentionally wider because real billing varies (28-35 days).
-    buckets = [
-        ("weekly", 7, 2),
-        ("monthly", 30, 7),
-        ("quarterly", 91, 12),
-        ("yearly", 365, 25),
-    ]
-
-    for name, target, tolerance in buckets:
+    for name, target, tolerance in CADENCE_BUCKETS:
         if abs(med - target) <= tolerance:
             within = sum(
                 1 for g in gaps
@@ -58,7 +127,7 @@ def _cadence_from_gaps(gaps: list[int]) -> tuple[str | None, float]:
     return None, 0.0
 
 
-def _amount_stability(amounts: list[float], tolerance_ratio: float = 0.12) -> float:
+def _amount_stability(amounts: list[int], tolerance_ratio: float = AMOUNT_TOLERANCE_RATIO) -> float:
     """
     Measure how consistent charge amounts are.
     Returns a stability score between 0 and 1.
@@ -91,33 +160,12 @@ def _merchant_signal(merchant_key: str, display_name: str) -> float:
 
     text = f"{merchant_key} {display_name}".lower()
 
-    # Curated keyword lists: keep these tight and biased toward high-signal terms.
-    # (The goal is to nudge borderline cases, not to "detect" subscriptions purely by keywords.)
-    boost_keywords = [
-        "netflix", "hulu", "spotify", "pandora", "apple", "icloud", "itunes", "app store",
-        "max", "hbomax", "disney", "prime", "amazon prime", "youtube", "yt premium",
-        "spectrum", "comcast", "xfinity", "verizon", "att", "tmobile", "internet",
-        "electric", "energy", "water", "utility", "sewer", "gas",
-        "insurance", "premium", "geico", "progressive", "state farm",
-        "membership", "subscription", "billing", "recurring",
-        "loan", "car payment", "lease",
-        "capital one", "discover", "chase", "credit one", "amex",
-    ]
-
-    penalty_keywords = [
-        "doordash", "uber", "ubereats", "grubhub",
-        "mcdonald", "wendy", "taco", "domino", "pizza", "kfc", "burger", "chipotle", "papa", "subway", "sonic",
-        "restaurant", "grill", "cafe", "bar", "steakhouse",
-        "meijer", "walmart", "target", "marathon", "shell", "bp",
-        "service fee", "transfer", "fee"
-    ]
-
     score = 1.0
 
-    if any(k in text for k in boost_keywords):
+    if _BOOST_RE.search(text):
         score += 0.25
 
-    if any(k in text for k in penalty_keywords):
+    if _PENALTY_RE.search(text):
         score -= 0.35
 
     # Clamp to a reasonable range so keywords can't overpower cadence/amount signals.
@@ -129,28 +177,149 @@ def _merchant_signal(merchant_key: str, display_name: str) -> float:
     return score
 
 
+def _evidence_factor(n: int) -> float:
+    """
+    Evidence factor: fewer occurrences => lower confidence ceiling.
+    This prevents 2-charge "coincidences" from dominating the candidate list.
+    """
+    if n >= 5:
+        return 1.0
+    if n == 4:
+        return 0.9
+    if n == 3:
+        return 0.8
+    return 0.6
+
+
+def _passes_thresholds(n: int, cadence_score: float, merchant_factor: float, confidence: float) -> bool:
+    """Apply the minimum-confidence rules to a scored merchant."""
+    # With only 2 occurrences, require "perfect" cadence match + non-penalized merchant signal.
+    if n == 2:
+        if merchant_factor < 0.95 or cadence_score < 1.0:
+            return False
+        return confidence >= 0.45
+
+    return confidence >= 0.50
+
+
+def _cadence_days(cadence: str) -> int:
+    """Days between charges for a cadence (anything unrecognized is treated as yearly)."""
+    if cadence == "weekly":
+        return 7
+    if cadence == "monthly":
+        return 30
+    if cadence == "quarterly":
+        return 91
+    return 365
+
+
 def _predict_next(last_seen: date, cadence: str) -> date:
     """Predict the next charge date from cadence.
 
     Note: Month/quarter are approximated as 30/91 days; this is for "heads up" UX,
     not exact billing-day forecasting.
     """
-    if cadence == "weekly":
-        return last_seen + timedelta(days=7)
-    if cadence == "monthly":
-        return last_seen + timedelta(days=30)
-    if cadence == "quarterly":
-        return last_seen + timedelta(days=91)
-    return last_seen + timedelta(days=365)
+    return last_seen + timedelta(days=_cadence_days(cadence))
+
+
+def iter_occurrences(due: date, cadence: str, start: date):
+    """
+    Lazily yield every charge date on or after `start` for a schedule anchored at `due`,
+    stepping with _predict_next. A stale anchor (before `start`) is fast-forwarded by
+    whole periods in one step, so old subscriptions cost nothing extra.
+    """
+    if due < start:
+        step = _cadence_days(cadence)
+        due += timedelta(days=-(-(start - due).days // step) * step)
+
+    while True:
+        yield due
+        due = _predict_next(due, cadence)
+
+
+def _keyed_occurrences(key, due: date, cadence: str, start: date):
+    for occurrence in iter_occurrences(due, cadence, start):
+        yield occurrence, key
+
+
+def expand_upcoming(schedules, start: date, end: date):
+    """
+    Yield (due_date, key) for every occurrence in [start, end] across many schedules,
+    in date order (ties by key).
+
+    `schedules` is an iterable of (key, due, cadence). The per-schedule generators are
+    merged through a heap, so memory is one pending occurrence per schedule no matter
+    how long the horizon is, and nothing past `end` is ever generated.
+    """
+    streams = [_keyed_occurrences(key, due, cadence, start) for key, due, cadence in schedules]
+
+    for occurrence in heapq.merge(*streams):
+        if occurrence[0] > end:
+            return
+        yield occurrence
+
+
+def merge_history(
+    recent_dates: list[int],
+    recent_amounts: list[int],
+    charges,
+    window: int = HISTORY_WINDOW,
+) -> tuple[list[int], list[int], int]:
+    """
+    Fold new (date ordinal, amount_cents) charges (e.g. a ChargeColumns) into a merchant's
+    rolling history window.
+    Returns (sorted date ordinals, aligned amounts in cents, number of charges added).
+
+    Charges already present in the window (same day, same amount) are ignored so
+    re-importing an overlapping statement doesn't create zero-day gaps.
+    """
+    merged = list(zip(recent_dates, recent_amounts))
+    seen = set(merged)
+    added = 0
+
+    for key in charges:
+
+        if key in seen:
+            continue
+
+        seen.add(key)
+        merged.append(key)
+        added += 1
+
+    # Tuples sort by ordinal first, so the window always keeps the newest charges.
+    merged.sort()
+    merged = merged[-window:]
+
+    return [d for d, _ in merged], [c for _, c in merged], added
+
+
+def summarize_history(
+    recent_dates: list[int],
+    recent_amounts: list[int],
+) -> tuple[float | None, int | None]:
+    """Return (median gap in days, median amount in cents) for a history window."""
+    median_gap = None
+    median_cents = None
+
+    if len(recent_dates) >= 2:
+        median_gap = float(median(
+            recent_dates[i] - recent_dates[i - 1]
+            for i in range(1, len(recent_dates))
+        ))
+
+    if recent_amounts:
+        median_cents = round(median(recent_amounts))
+
+    return median_gap, median_cents
 
 
 def detect_recurring(
     merchant_key: str,
     display_name: str,
-    charges: list[tuple[date, float]],
+    charges: list[tuple[date, int]],
 ) -> CandidateResult | None:
     """
-    Detect recurring billing patterns for a merchant.
+    Detect recurring billing patterns for a merchant from (date, amount_cents) charges.
     Returns a CandidateResult if detected, otherwise None.
     """
 
@@ -161,7 +330,7 @@ def detect_recurring(
         return None
 
     dates = [d for d, _ in sorted_charges]
-    amounts = [float(a) for _, a in sorted_charges]
+    amounts = [a for _, a in sorted_charges]
 
     # Calculate day gaps between consecutive charges
     gaps = [
@@ -176,17 +345,8 @@ def detect_recurring(
 
     amount_score = _amount_stability(amounts)
 
-    # Evidence factor: fewer occurrences => lower confidence ceiling.
-    # This prevents 2-charge "coincidences" from dominating the candidate list.
     n = len(sorted_charges)
-    if n >= 5:
-        evidence = 1.0
-    elif n == 4:
-        evidence = 0.9
-    elif n == 3:
-        evidence = 0.8
-    else:
-        evidence = 0.6
+    evidence = _evidence_factor(n)
 
     merchant_factor = _merchant_signal(merchant_key, display_name)
 
@@ -195,21 +355,11 @@ def detect_recurring(
     base_confidence = (0.75 * cadence_score) + (0.25 * amount_score)
     confidence = round(base_confidence * evidence * merchant_factor, 4)
 
-    # Thresholds:
-    # With only 2 occurrences, require "perfect" cadence match + non-penalized merchant signal.
-    if n == 2:
-        if merchant_factor < 0.95 or cadence_score < 1.0:
-            return None
-        if confidence < 0.45:
-            return None
-    else:
-        if confidence < 0.50:
-            return None
-
-    # Decimal(str(...)) avoids float rounding artifacts when formatting money.
-    avg_amount = float(
-        round(Decimal(str(median(amounts))), 2)
-    )
+    if not _passes_thresholds(n, cadence_score, merchant_factor, confidence):
+        return None
+
+    # An even-length median can land on half a cent; round() keeps it an exact int.
+    avg_amount_cents = round(median(amounts))
 
     last_seen = dates[-1]
     next_predicted = _predict_next(last_seen, cadence)
@@ -217,9 +367,247 @@ def detect_recurring(
     return CandidateResult(
         merchant_key=merchant_key,
         display_name=display_name,
-        avg_amount=avg_amount,
+        avg_amount_cents=avg_amount_cents,
         cadence_guess=cadence,
         confidence=confidence,
         last_seen=last_seen,
         next_predicted=next_predicted,
     )
+
+
+def _grouped_median(groups, values, counts, starts):
+    """Median of `values` per group (same semantics as statistics.median). NaN for empty groups."""
+    ordered = values[np.lexsort((values, groups))]
+
+    result = np.full(len(counts), np.nan)
+    present = counts > 0
+
+    # Odd counts pick the same element twice, so (x + x) / 2 == x exactly.
+    lo = starts[present] + (counts[present] - 1) // 2
+    hi = starts[present] + counts[present] // 2
+    result[present] = (ordered[lo] + ordered[hi]) / 2
+
+    return result
+
+
+def detect_recurring_batch(
+    merchant_keys: list[str],
+    display_names: list[str],
+    merchant_idx,
+    date_ordinals,
+    amounts,
+) -> list[CandidateResult]:
+    """
+    Run detect_recurring for many merchants at once from columnar inputs.
+
+    `merchant_idx[i]`, `date_ordinals[i]` and `amounts[i]` (integer cents) describe one charge; the index points
+    into `merchant_keys`/`display_names`. Gaps, medians, cadence buckets and amount stability
+    are computed with grouped NumPy operations. Returns results in merchant index order,
+    identical to calling detect_recurring per merchant.
+    """
+    if np is None:
+        charges_by_merchant = [[] for _ in merchant_keys]
+
+        for idx, ordinal, amount in zip(merchant_idx, date_ordinals, amounts):
+            charges_by_merchant[idx].append((date.fromordinal(ordinal), amount))
+
+        results = (
+            detect_recurring(key, name, charges)
+            for key, name, charges in zip(merchant_keys, display_names, charges_by_merchant)
+        )
+        return [r for r in results if r]
+
+    n_groups = len(merchant_keys)
+
+    groups = np.asarray(merchant_idx, dtype=np.int64)
+    ordinals = np.asarray(date_ordinals, dtype=np.int64)
+    values = np.asarray(amounts, dtype=np.int64)
+
+    if not len(groups):
+        return []
+
+    # Sort charges by (merchant, date) so gaps and "last seen" are consistent.
+    order = np.lexsort((ordinals, groups))
+    groups, ordinals, values = groups[order], ordinals[order], values[order]
+
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+
+    # Day gaps between consecutive charges of the same merchant
+    same_merchant = groups[1:] == groups[:-1]
+    gaps = (ordinals[1:] - ordinals[:-1])[same_merchant]
+    gap_groups = groups[1:][same_merchant]
+
+    gap_counts = np.bincount(gap_groups, minlength=n_groups)
+    gap_starts = np.cumsum(gap_counts) - gap_counts
+    gap_median = _grouped_median(gap_groups, gaps, gap_counts, gap_starts)
+
+    # First bucket whose tolerance contains the median gap wins, as in _cadence_from_gaps.
+    bucket = np.full(n_groups, -1)
+    for b, (_, target, tolerance) in enumerate(CADENCE_BUCKETS):
+        match = (bucket == -1) & (gap_counts > 0) & (np.abs(gap_median - target) <= tolerance)
+        bucket[match] = b
+
+    # The trailing sentinel (picked by bucket == -1) has a negative tolerance, so it never matches.
+    targets = np.array([t for _, t, _ in CADENCE_BUCKETS] + [0])
+    tolerances = np.array([tol for _, _, tol in CADENCE_BUCKETS] + [-1])
+
+    gap_bucket = bucket[gap_groups]
+    gap_within = np.abs(gaps - targets[gap_bucket]) <= tolerances[gap_bucket]
+    cadence_score = (
+        np.bincount(gap_groups, weights=gap_within, minlength=n_groups)
+        / np.maximum(1, gap_counts)
+    )
+
+    amount_median = _grouped_median(groups, values, counts, starts)
+    amount_tolerance = np.abs(amount_median) * AMOUNT_TOLERANCE_RATIO
+    amount_within = np.abs(values - amount_median[groups]) <= amount_tolerance[groups]
+    amount_score = np.where(
+        amount_median == 0,
+        0.0,
+        np.bincount(groups, weights=amount_within, minlength=n_groups) / np.maximum(1, counts)
+    )
+
+    evidence = np.select(
+        [counts >= 5, counts == 4, counts == 3],
+        [1.0, 0.9, 0.8],
+        default=0.6
+    )
+
+    # Only merchants with a cadence match need the (string-based) merchant signal and final rounding.
+    results = []
+    for i in np.flatnonzero((counts >= 2) & (bucket >= 0)):
+        n = int(counts[i])
+        merchant_factor = _merchant_signal(merchant_keys[i], display_names[i])
+
+        base_confidence = (0.75 * cadence_score[i]) + (0.25 * amount_score[i])
+        confidence = round(float(base_confidence * evidence[i] * merchant_factor), 4)
+
+        if not _passes_thresholds(n, float(cadence_score[i]), merchant_factor, confidence):
+            continue
+
+        cadence = CADENCE_BUCKETS[bucket[i]][0]
+        last_seen = date.fromordinal(int(ordinals[starts[i] + n - 1]))
+
+        results.append(CandidateResult(
+            merchant_key=merchant_keys[i],
+            display_name=display_names[i],
+            avg_amount_cents=round(float(amount_median[i])),
+            cadence_guess=cadence,
+            confidence=confidence,
+            last_seen=last_seen,
+            next_predicted=_predict_next(last_seen, cadence),
+        ))
+
+    return results
+
+
+# Process pool shared by every request in this worker; created by init_detection_pool when
+# DETECTION_WORKERS > 1 (or on first use outside an app).
+_detection_pool = None
+_detection_pool_workers = 0
+_detection_pool_lock = threading.Lock()
+
+
+def _get_detection_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared detection pool, (re)creating it if the worker count changed."""
+    global _detection_pool, _detection_pool_workers
+
+    with _detection_pool_lock:
+        if _detection_pool is None or _detection_pool_workers != workers:
+            if _detection_pool is not None:
+                _detection_pool.shutdown(wait=False)
+
+            _detection_pool = ProcessPoolExecutor(max_workers=workers, mp_context=_detection_mp_context())
+            _detection_pool_workers = workers
+
+        return _detection_pool
+
+
+def _detection_mp_context():
+    """
+    Start pool workers from a clean process, never by forking this one: the web process runs
+    bcrypt, import-job and DB pool threads, and a fork taken while one of them holds a lock
+    can deadlock the child. forkserver (Linux) forks from a single-threaded server instead;
+    spawn elsewhere.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        # Workers fork from the server with the detector already imported.
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+
+    return multiprocessing.get_context("spawn")
+
+
+def init_detection_pool(app) -> None:
+    """Create the detection pool at startup when DETECTION_WORKERS > 1, rather than mid-request."""
+    workers = app.config["DETECTION_WORKERS"]
+    if workers > 1:
+        _get_detection_pool(workers)
+
+
+def _detect_shard(shard: tuple) -> list[CandidateResult]:
+    """Process-pool entry point: run the batched detector over one shard."""
+    return detect_recurring_batch(*shard)
+
+
+def detect_recurring_parallel(
+    merchant_keys: list[str],
+    display_names: list[str],
+    merchant_idx,
+    date_ordinals,
+    amounts,
+    workers: int = 1,
+    min_shard_size: int = 5000,
+) -> list[CandidateResult]:
+    """
+    Same inputs and output as detect_recurring_batch, optionally sharded across processes.
+
+    Merchants are split into contiguous index ranges of at least `min_shard_size` merchants,
+    one per worker at most. Shard results are concatenated in shard order, so the output
+    is identical to a single in-process call. Imports too small to fill two shards run
+    in-process and never touch the pool.
+    """
+    n_merchants = len(merchant_keys)
+    shards = min(workers, n_merchants // max(1, min_shard_size))
+
+    if shards <= 1:
+        return detect_recurring_batch(
+            merchant_keys,
+            display_names,
+            merchant_idx,
+            date_ordinals,
+            amounts
+        )
+
+    bounds = [n_merchants * s // shards for s in range(shards + 1)]
+    shard_of = [0] * n_merchants
+    for s in range(shards):
+        shard_of[bounds[s]:bounds[s + 1]] = [s] * (bounds[s + 1] - bounds[s])
+
+    # Re-index each charge relative to its shard's first merchant.
+    columns = [([], [], []) for _ in range(shards)]
+    for idx, ordinal, amount in zip(merchant_idx, date_ordinals, amounts):
+        s = shard_of[idx]
+        local_idx, local_dates, local_amounts = columns[s]
+        local_idx.append(idx - bounds[s])
+        local_dates.append(ordinal)
+        local_amounts.append(amount)
+
+    payloads = [
+        (
+            merchant_keys[bounds[s]:bounds[s + 1]],
+            display_names[bounds[s]:bounds[s + 1]],
+            *columns[s],
+        )
+        for s in range(shards)
+    ]
+
+    pool = _get_detection_pool(workers)
+
+    results = []
+    for shard_results in pool.map(_detect_shard, payloads):
+        results.extend(shard_results)
+
+    return results
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+from datetime import datetime
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .. import db
+from ..models.subscription import Subscription
+from ..models.summary import UserSummary
+
+
+# How many subscriptions the dashboard lists under "top subscriptions"
+TOP_SUBSCRIPTIONS = 5
+
+
+def monthly_equivalent(amount: float, cadence: str) -> float:
+    """Convert an amount + cadence into a monthly-equivalent cost.
+
+    Note: weekly uses 52/12 as an approximation (not 365.25/7), which is fine for
+    budgeting summaries but will never be perfectly exact month-to-month.
+    """
+    if cadence == "weekly":
+        return amount * 52 / 12
+    if cadence == "monthly":
+        return amount
+    if cadence == "quarterly":
+        return amount / 3
+    if cadence == "yearly":
+        return amount / 12
+
+    # Fallback: treat unknown cadence as monthly to avoid breaking the dashboard.
+    return amount
+
+
+def monthly_equivalent_cents(amount: float, cadence: str) -> int:
+    """
+    One subscription's monthly-equivalent cost rounded to whole cents: the unit the summary
+    totals are kept in, so adding and removing it later cancels out exactly.
+    """
+    return round(monthly_equivalent(amount, cadence) * 100)
+
+
+def subscription_snapshot(sub: Subscription | None) -> tuple[float, str] | None:
+    """The part of a subscription the summary depends on: (amount, cadence) if active, else None."""
+    if sub is None or sub.status != "active":
+        return None
+
+    return float(sub.amount), sub.cadence
+
+
+def _top_subscriptions(user_id: int) -> list[dict]:
+    """Query the highest nominal active charges (not monthly-equivalent) for quick visibility."""
+    rows = db.session.query(
+        Subscription.id,
+        Subscription.name,
+        Subscription.amount,
+        Subscription.cadence,
+    ).filter_by(
+        user_id=user_id,
+        status="active"
+    ).order_by(
+        # Both descending so ix_subscriptions_user_status_amount can be walked backwards.
+        Subscription.amount.desc(),
+        Subscription.id.desc()
+    ).limit(TOP_SUBSCRIPTIONS)
+
+    return [
+        {"id": r.id, "name": r.name, "amount": float(r.amount), "cadence": r.cadence}
+        for r in rows
+    ]
+
+
+def _summary_values(user_id: int) -> dict:
+    """A user's summary columns computed from scratch from their active subscriptions."""
+    # Grouped by amount as well, so each subscription is rounded to cents exactly as
+    # apply_subscription_change rounds it.
+    rows = db.session.query(
+        Subscription.cadence,
+        Subscription.amount,
+        func.count(Subscription.id),
+    ).filter_by(
+        user_id=user_id,
+        status="active"
+    ).group_by(Subscription.cadence, Subscription.amount)
+
+    monthly_cents = 0
+    active_count = 0
+
+    for cadence, amount, count in rows:
+        monthly_cents += monthly_equivalent_cents(float(amount), cadence) * count
+        active_count += count
+
+    return {
+        "monthly_total_cents": monthly_cents,
+        "annual_total_cents": monthly_cents * 12,
+        "active_count": active_count,
+        "top_subscriptions": _top_subscriptions(user_id),
+    }
+
+
+def _insert_summary_if_missing(values: dict) -> None:
+    """INSERT a summary row that silently does nothing if the user already has one."""
+    table = UserSummary.__table__
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        stmt = sqlite.insert(table).on_conflict_do_nothing(index_elements=["user_id"])
+    elif dialect == "postgresql":
+        stmt = postgresql.insert(table).on_conflict_do_nothing(index_elements=["user_id"])
+    else:
+        # MySQL/MariaDB
+        stmt = table.insert().prefix_with("IGNORE")
+
+    db.session.execute(stmt, values)
+
+
+def rebuild_summary(user_id: int) -> UserSummary:
+    """
+    Recompute a user's summary from their active subscriptions (repair, or a user who has
+    no row). Creating the row can't fail on a concurrent rebuild: the insert is skipped if
+    the row appeared meanwhile, then both just write the same recomputed values.
+    """
+    values = _summary_values(user_id)
+
+    _insert_summary_if_missing({"user_id": user_id, "updated_at": datetime.utcnow(), **values})
+    db.session.execute(
+        update(UserSummary)
+        .where(UserSummary.user_id == user_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+    return db.session.get(UserSummary, user_id, populate_existing=True)
+
+
+def get_summary(user_id: int) -> UserSummary:
+    """
+    Return the user's summary. Rows are created at registration (and by migration for
+    earlier users); should one be missing, the summary is computed without being stored,
+    so reads never write.
+    """
+    summary = db.session.get(UserSummary, user_id)
+    if summary is not None:
+        return summary
+
+    return UserSummary(user_id=user_id, updated_at=datetime.utcnow(), **_summary_values(user_id))
+
+
+def apply_subscription_change(user_id: int, before, after) -> None:
+    """
+    Fold one subscription change into the user's summary inside the caller's transaction.
+
+    `before`/`after` are subscription_snapshot() values from either side of the change
+    (None for "not counted", e.g. created, deleted or canceled). Totals are adjusted in
+    integer cents with an atomic UPDATE so concurrent edits don't lose each other's deltas
+    and repeated edits don't accumulate float error; the short top-N list is simply re-queried.
+    """
+    monthly_delta = 0
+    count_delta = 0
+
+    if before is not None:
+        monthly_delta -= monthly_equivalent_cents(*before)
+        count_delta -= 1
+
+    if after is not None:
+        monthly_delta += monthly_equivalent_cents(*after)
+        count_delta += 1
+
+    # Make sure the change itself is visible to the queries below.
+    db.session.flush()
+
+    updated = db.session.execute(
+        update(UserSummary)
+        .where(UserSummary.user_id == user_id)
+        .values(
+            monthly_total_cents=UserSummary.monthly_total_cents + monthly_delta,
+            annual_total_cents=UserSummary.annual_total_cents + monthly_delta * 12,
+            active_count=UserSummary.active_count + count_delta,
+            top_subscriptions=_top_subscriptions(user_id),
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+    # No summary yet: build it from scratch (the flushed change is already included).
+    if updated.rowcount == 0:
+        rebuild_summary(user_id)
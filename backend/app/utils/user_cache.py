@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+
+from .. import db
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Immutable snapshot of a user row; safe to share across requests and threads."""
+
+    id: int
+    email: str
+    created_at: datetime
+
+
+class UserCache:
+    """
+    LRU cache of CachedUser by id with a time-to-live.
+
+    Entries expire after `ttl_seconds` (the access token lifetime by default), and are
+    dropped immediately when the row changes in this process (see _invalidate_user).
+    Counts hits, misses and evictions for /api/_metrics.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # user_id -> (expires_at, CachedUser)
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> CachedUser | None:
+        """The user's snapshot, loading it by primary key on a miss; None if there's no such user."""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        from ..models.user import User
+
+        row = db.session.execute(
+            db.select(User.id, User.email, User.created_at).where(User.id == user_id)
+        ).first()
+
+        if row is None:
+            return None
+
+        user = CachedUser(id=row.id, email=row.email, created_at=row.created_at)
+
+        with self._lock:
+            self._entries[user_id] = (now + self.ttl_seconds, user)
+            self._entries.move_to_end(user_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def render_metrics(self, prefix: str) -> list[str]:
+        """Prometheus lines for the profiling registry's /api/_metrics output."""
+        with self._lock:
+            hits, misses, evictions, size = self.hits, self.misses, self.evictions, len(self._entries)
+
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+
+        return [
+            f"# HELP {prefix}_user_cache_hits_total JWT user lookups served from the cache.",
+            f"# TYPE {prefix}_user_cache_hits_total counter",
+            f"{prefix}_user_cache_hits_total {hits}",
+            f"# HELP {prefix}_user_cache_misses_total JWT user lookups that loaded the row.",
+            f"# TYPE {prefix}_user_cache_misses_total counter",
+            f"{prefix}_user_cache_misses_total {misses}",
+            f"# HELP {prefix}_user_cache_evictions_total Entries dropped to stay within the size limit.",
+            f"# TYPE {prefix}_user_cache_evictions_total counter",
+            f"{prefix}_user_cache_evictions_total {evictions}",
+            f"# HELP {prefix}_user_cache_entries Users currently cached.",
+            f"# TYPE {prefix}_user_cache_entries gauge",
+            f"{prefix}_user_cache_entries {size}",
+            f"# HELP {prefix}_user_cache_hit_ratio Hits over all lookups since start.",
+            f"# TYPE {prefix}_user_cache_hit_ratio gauge",
+            f"{prefix}_user_cache_hit_ratio {ratio:.4f}",
+        ]
+
+
+def _invalidate_user(mapper, connection, target) -> None:
+    """Drop a user's entry from the current app's cache when this process updates or deletes the row."""
+    if has_app_context():
+        cache = current_app.extensions.get("user_cache")
+        if cache is not None:
+            cache.invalidate(target.id)
+
+
+def _register_invalidation() -> None:
+    """Attach the User mapper listeners once per process, however many apps are created."""
+    from ..models.user import User
+
+    for identifier in ("after_update", "after_delete"):
+        if not event.contains(User, identifier, _invalidate_user):
+            event.listen(User, identifier, _invalidate_user)
+
+
+def init_user_cache(app, jwt) -> None:
+    """
+    Back flask_jwt_extended's current_user with the cache (USER_CACHE_SIZE entries for
+    USER_CACHE_TTL_SECONDS). Every @jwt_required request resolves its user through it, so
+    a token whose account no longer exists is rejected with 401.
+    """
+    cache = UserCache(
+        max_size=app.config["USER_CACHE_SIZE"],
+        ttl_seconds=app.config["USER_CACHE_TTL_SECONDS"]
+    )
+    app.extensions["user_cache"] = cache
+
+    _register_invalidation()
+
+    # The JWTManager is shared by every app in the process, so resolve the cache per app.
+    @jwt.user_lookup_loader
+    def load_user(jwt_header, jwt_data):
+        return current_app.extensions["user_cache"].get(int(jwt_data["sub"]))
+
+    registry = app.extensions.get("profiling")
+    if registry is not None:
+        registry.add_collector(cache.render_metrics)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Rows/second for writing imported transactions on SQLite: per-row ORM adds vs. chunked Core executemany.
+
+    python benchmarks/bench_bulk_insert.py
+    python benchmarks/bench_bulk_insert.py --rows 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _rows(n: int, user_id: int, import_id: int):
+    start = date(2020, 1, 1)
+    for i in range(n):
+        yield {
+            "user_id": user_id,
+            "import_id": import_id,
+            "txn_date": start + timedelta(days=i % 2000),
+            "merchant_raw": f"MERCHANT {i % 500}",
+            "merchant_key": f"MERCHANT {i % 500}",
+            "amount_cents": i % 9000 + 100,
+            "fingerprint": f"{import_id}-{i}",  # unique stand-in; hashing isn't what's measured
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+
+    from app import create_app, db
+    from app.models.user import User
+    from app.models.transaction import TransactionImport, Transaction
+    from app.utils.importer import TXN_INSERT_CHUNK_SIZE
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+
+        user = User(email="bench@example.com", password_hash=b"x")
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+        results = {}
+
+        # Baseline: one ORM object per row, single flush, single commit.
+        imp = TransactionImport(user_id=user_id, filename="orm.csv")
+        db.session.add(imp)
+        db.session.flush()
+
+        started = time.perf_counter()
+        for row in _rows(args.rows, user_id, imp.id):
+            db.session.add(Transaction(**row))
+        db.session.flush()
+        db.session.commit()
+        results["orm"] = time.perf_counter() - started
+        db.session.expunge_all()
+
+        # Bulk path: fixed-size chunks through Core executemany, same transaction as the import record.
+        imp = TransactionImport(user_id=user_id, filename="core.csv")
+        db.session.add(imp)
+        db.session.flush()
+
+        table = Transaction.__table__
+        started = time.perf_counter()
+        chunk = []
+        for row in _rows(args.rows, user_id, imp.id):
+            chunk.append(row)
+            if len(chunk) >= TXN_INSERT_CHUNK_SIZE:
+                db.session.execute(table.insert(), chunk)
+                chunk = []
+        if chunk:
+            db.session.execute(table.insert(), chunk)
+        db.session.commit()
+        results["core"] = time.perf_counter() - started
+
+    print(f"{'path':>6} {'rows':>9} {'seconds':>9} {'rows/s':>10}")
+    for name, elapsed in results.items():
+        print(f"{name:>6} {args.rows:>9} {elapsed:>9.2f} {args.rows / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
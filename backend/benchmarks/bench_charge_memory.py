@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Memory held by the importer's per-merchant charge history: list of tuples vs. ChargeColumns.
+
+Builds the by_merchant structure for --rows charges (1M by default) spread over
+--merchants merchants exactly as a large import would, once as the previous
+{key: [(date, cents), ...]} layout and once as {key: ChargeColumns}, and reports
+the bytes tracemalloc attributes to each plus the time to build it.
+
+    python benchmarks/bench_charge_memory.py
+    python benchmarks/bench_charge_memory.py --rows 200000 --merchants 500
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.recurrence import ChargeColumns  # noqa: E402
+
+
+def make_seed(rows: int, merchants: int) -> list[tuple[int, int, int]]:
+    """(merchant index, date ordinal, cents - 100) per row; dates repeat like a real statement's."""
+    rng = random.Random(18)
+    start = date(2021, 1, 1).toordinal()
+
+    return [
+        (rng.randrange(merchants), start + rng.randrange(1500), rng.randrange(50_000))
+        for _ in range(rows)
+    ]
+
+
+def parsed_rows(seed, keys):
+    """
+    Parsed (merchant_key, txn_date, cents) rows as the importer produces them: a fresh
+    date and int per row, dropped after the row unless the history keeps them alive.
+    """
+    for idx, ordinal, offset in seed:
+        yield keys[idx], date.fromordinal(ordinal), offset + 100
+
+
+def build_tuples(rows):
+    by_merchant = {}
+    for merchant_key, txn_date, cents in rows:
+        by_merchant.setdefault(merchant_key, []).append((txn_date, cents))
+    return by_merchant
+
+
+def build_columns(rows):
+    by_merchant = {}
+    for merchant_key, txn_date, cents in rows:
+        charges = by_merchant.get(merchant_key)
+        if charges is None:
+            charges = by_merchant[merchant_key] = ChargeColumns()
+        charges.append(txn_date.toordinal(), cents)
+    return by_merchant
+
+
+def measure(build, rows) -> tuple[int, float]:
+    """Bytes allocated by build(rows) that are still live afterwards, and seconds taken."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    started = time.perf_counter()
+    result = build(rows)
+    seconds = time.perf_counter() - started
+
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+
+    return size, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--merchants", type=int, default=2000)
+    args = parser.parse_args()
+
+    seed = make_seed(args.rows, args.merchants)
+    keys = [f"MERCHANT {m}" for m in range(args.merchants)]
+
+    print(f"{args.rows:,} charges over {args.merchants:,} merchants")
+    print(f"{'layout':>14} {'MiB':>9} {'bytes/charge':>13} {'build s':>9}")
+
+    results = {}
+    for name, build in (("list[tuple]", build_tuples), ("ChargeColumns", build_columns)):
+        size, seconds = measure(build, parsed_rows(seed, keys))
+        results[name] = size
+        print(f"{name:>14} {size / 1048576:>9.1f} {size / args.rows:>13.1f} {seconds:>9.3f}")
+
+    saved = results["list[tuple]"] - results["ChargeColumns"]
+    print(f"saved {saved / 1048576:.1f} MiB ({saved / results['list[tuple]']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
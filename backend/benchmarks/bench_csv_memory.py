@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Peak RSS of CSV ingestion: whole-file decode vs. streaming reader.
+
+Each (mode, size) pair runs in a fresh subprocess so ru_maxrss reflects only that run.
+
+    python benchmarks/bench_csv_memory.py
+    python benchmarks/bench_csv_memory.py --sizes 10000 100000
+"""
+
+import argparse
+import csv
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.csv_stream import open_csv_stream  # noqa: E402
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def _legacy_clean_csv_text(raw_text: str) -> str:
+    """The pre-streaming header finder, kept here as the comparison baseline."""
+    lines = [ln.strip("\ufeff").rstrip() for ln in raw_text.splitlines()]
+
+    for i, ln in enumerate(lines):
+        if not ln or "," not in ln:
+            continue
+        lowered = ln.lower()
+        if "date" in lowered and "amount" in lowered:
+            return "\n".join(lines[i:])
+
+    return raw_text
+
+
+def _write_fixture(path: str, rows: int) -> None:
+    """Write a bank-style export with a metadata preamble and `rows` transactions."""
+    merchants = ["NETFLIX.COM 1234", "SPOTIFY USA", "SHELL OIL 5567", "KROGER #221", "GEICO AUTO"]
+    start = date(2020, 1, 1)
+
+    with open(path, "w", newline="") as fh:
+        fh.write("Account Name : Checking\nAccount Number : 0000\n\n")
+        writer = csv.writer(fh)
+        writer.writerow(["Date", "Description", "Memo", "Amount Debit", "Amount Credit"])
+
+        for i in range(rows):
+            d = start + timedelta(days=i % 2000)
+            writer.writerow([
+                d.strftime("%m/%d/%Y"),
+                "POS PURCHASE",
+                merchants[i % len(merchants)],
+                f"-{(i % 9000) / 100 + 1:.2f}",
+                "",
+            ])
+
+
+def _child(mode: str, path: str) -> None:
+    """Consume every row of `path` using `mode` and print peak RSS in KiB."""
+    with open(path, "rb") as fh:
+        if mode == "legacy":
+            content = _legacy_clean_csv_text(fh.read().decode("utf-8", errors="ignore"))
+            reader = csv.DictReader(io.StringIO(content))
+        else:
+            reader = open_csv_stream(fh)
+            next(reader)  # header row (DictReader consumes it itself)
+
+        rows = sum(1 for _ in reader)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{rows} {peak}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    print(f"{'rows':>10} {'file MiB':>9} {'legacy RSS MiB':>15} {'stream RSS MiB':>15}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"export_{size}.csv")
+            _write_fixture(path, size)
+
+            peaks = {}
+            for mode in ("legacy", "stream"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, path],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.split()
+                peaks[mode] = int(out[1]) / 1024
+
+            file_mib = os.path.getsize(path) / (1024 * 1024)
+            print(f"{size:>10} {file_mib:>9.1f} {peaks['legacy']:>15.1f} {peaks['stream']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
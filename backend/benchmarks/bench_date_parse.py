@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Per-row date parsing cost: generic strptime/fromisoformat path vs. the inferred fast parser.
+
+Runs --rows date strings (1M by default) drawn from --days distinct dates through
+  - generic:  parse_date_generic on every row (the old importer behaviour)
+  - fast:     the specialized fixed-width parser alone, no memo
+  - importer: DateParser as the importer uses it (inference + fast path + memo)
+for both MM/DD/YYYY and YYYY-MM-DD inputs.
+
+    python benchmarks/bench_date_parse.py
+    python benchmarks/bench_date_parse.py --rows 200000 --days 365
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.dates import DateParser, _parse_iso, _parse_us, parse_date_generic  # noqa: E402
+
+
+def make_values(rows: int, days: int, style: str, rng: random.Random) -> list[str]:
+    start = date(2023, 1, 1).toordinal()
+    fmt = "%m/%d/%Y" if style == "us" else "%Y-%m-%d"
+    pool = [date.fromordinal(start + i).strftime(fmt) for i in range(days)]
+    return [rng.choice(pool) for _ in range(rows)]
+
+
+def timed(parse, values: list[str]) -> tuple[float, list]:
+    started = time.perf_counter()
+    out = [parse(v) for v in values]
+    return time.perf_counter() - started, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=1095, help="distinct dates in the file")
+    args = parser.parse_args()
+
+    rng = random.Random(16)
+
+    print(f"{args.rows:,} rows, {args.days:,} distinct dates")
+    print(f"{'format':>10} {'path':>9} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+
+    for style, fast in (("us", _parse_us), ("iso", _parse_iso)):
+        values = make_values(args.rows, args.days, style, rng)
+
+        baseline, expected = timed(parse_date_generic, values)
+
+        for name, parse in (("generic", parse_date_generic), ("fast", fast), ("importer", DateParser())):
+            seconds, out = (baseline, expected) if name == "generic" else timed(parse, values)
+            assert out == expected, f"{name} disagrees with the generic parser"
+
+            print(
+                f"{style:>10} {name:>9} {seconds:>9.3f} {args.rows / seconds:>12,.0f} "
+                f"{baseline / seconds:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Recurrence detection throughput: per-merchant detect_recurring loop vs. detect_recurring_batch.
+
+Also checks that both paths return identical candidates.
+
+    python benchmarks/bench_detection.py
+    python benchmarks/bench_detection.py --merchants 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import recurrence  # noqa: E402
+
+
+def make_columns(merchants: int, seed: int = 11):
+    """Synthetic columnar charge data with a mix of recurring and noisy merchants."""
+    rng = random.Random(seed)
+    names = ["NETFLIX", "PIZZA PALACE", "GEICO", "CORNER SHOP", "SPOTIFY", "UBER", "CITY WATER"]
+
+    keys, display = [], []
+    merchant_idx, ordinals, amounts = [], [], []
+
+    for m in range(merchants):
+        key = f"{rng.choice(names)} {m}"
+        keys.append(key)
+        display.append(key.title())
+
+        count = rng.choice([1, 2, 3, 4, 6, 12, 24])
+        step = rng.choice([7, 30, 31, 91, 365, 13])
+        start = date(2022, 1, 1).toordinal() + rng.randint(0, 300)
+        base_cents = rng.choice([999, 1549, 6200, 12050])
+
+        for k in range(count):
+            merchant_idx.append(m)
+            ordinals.append(start + step * k + rng.choice([0, 0, 1, -1, 4]))
+            amounts.append(round(base_cents * rng.choice([1, 1, 1, 1.04, 1.5])))
+
+    return keys, display, merchant_idx, ordinals, amounts
+
+
+def run_scalar(keys, display, merchant_idx, ordinals, amounts):
+    """The per-merchant path as the import route used to run it."""
+    by_merchant = [[] for _ in keys]
+
+    for idx, ordinal, amount in zip(merchant_idx, ordinals, amounts):
+        by_merchant[idx].append((date.fromordinal(ordinal), amount))
+
+    results = (
+        recurrence.detect_recurring(key, name, charges)
+        for key, name, charges in zip(keys, display, by_merchant)
+    )
+    return [r for r in results if r]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--merchants", type=int, default=20_000)
+    args = parser.parse_args()
+
+    if recurrence.np is None:
+        sys.exit("NumPy is not installed; detect_recurring_batch would just run the scalar loop.")
+
+    columns = make_columns(args.merchants)
+    charges = len(columns[2])
+
+    started = time.perf_counter()
+    scalar = run_scalar(*columns)
+    scalar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = recurrence.detect_recurring_batch(*columns)
+    batch_s = time.perf_counter() - started
+
+    assert scalar == batch, "batched detector disagrees with detect_recurring"
+
+    print(f"{args.merchants} merchants, {charges} charges, {len(batch)} candidates (identical)")
+    print(f"{'path':>8} {'seconds':>9} {'merchants/s':>12}")
+    print(f"{'scalar':>8} {scalar_s:>9.3f} {args.merchants / scalar_s:>12.0f}")
+    print(f"{'batch':>8} {batch_s:>9.3f} {args.merchants / batch_s:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Candidate list serialization: ORM + to_dict() vs. plain rows, stdlib json vs. orjson.
+
+Seeds one user with --rows recurring candidates (10k by default) in a scratch SQLite
+database, then times the two halves of GET /api/candidates for every combination:
+building the items (ORM instances + to_dict(), or fetch_page's column rows) and
+encoding them into the response body (the stdlib encoder, or orjson when installed).
+Finishes with full requests through the test client using the app's configured provider.
+
+    python benchmarks/bench_json_serialize.py
+    python benchmarks/bench_json_serialize.py --rows 50000 --repeats 10
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def seed(db_path: str, rows: int, user_id: int, rng: random.Random) -> None:
+    """Bulk-load synthetic candidates straight through sqlite3 (the app isn't the thing timed here)."""
+    conn = sqlite3.connect(db_path)
+    created = datetime(2026, 1, 1, 12, 0, 0)
+
+    batch = []
+    for i in range(rows):
+        last_seen = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+        stamp = (created + timedelta(seconds=i, microseconds=rng.randrange(1_000_000))).isoformat(" ")
+        batch.append((
+            user_id,
+            f"MERCHANT {i}",
+            f"Merchant {i}",
+            f"{rng.randrange(100, 20_000) / 100:.2f}",
+            rng.choice(("weekly", "monthly", "yearly")),
+            round(rng.uniform(0.3, 1.2), 3),
+            last_seen.isoformat(),
+            (last_seen + timedelta(days=30)).isoformat(),
+            "pending",
+            stamp,
+            stamp,
+        ))
+
+    conn.executemany(
+        "INSERT INTO recurring_candidates "
+        "(user_id, merchant_key, display_name, avg_amount, cadence_guess, confidence, "
+        "last_seen, next_predicted, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        batch
+    )
+    conn.commit()
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=20, help="timed runs per combination")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-json-")
+    db_path = os.path.join(workdir, "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["IMPORT_QUEUE_PATH"] = os.path.join(workdir, "import_jobs.db")
+    os.environ["IMPORT_SPOOL_DIR"] = os.path.join(workdir, "import_spool")
+    os.environ.setdefault("JWT_SECRET_KEY", "bench-json-secret-key-0123456789abcdef")
+
+    from flask_jwt_extended import create_access_token
+
+    from app import create_app, db
+    from app.models.candidate import RecurringCandidate
+    from app.models.user import User
+    from app.routes.candidates import CANDIDATE_SORT_KEYS
+    from app.utils.json_provider import FastJSONProvider, orjson
+    from app.utils.pagination import fetch_page
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        user = User(email="bench@example.com", password_hash=b"x")
+        db.session.add(user)
+        db.session.commit()
+
+        user_id = user.id
+        token = create_access_token(identity=str(user_id))
+
+    seed(db_path, args.rows, user_id, random.Random(25))
+
+    criteria = [RecurringCandidate.user_id == user_id, RecurringCandidate.status == "pending"]
+
+    def orm_items():
+        candidates = (
+            RecurringCandidate.query
+            .filter(*criteria)
+            .order_by(RecurringCandidate.confidence.desc(), RecurringCandidate.id.desc())
+            .all()
+        )
+        return [c.to_dict() for c in candidates]
+
+    def row_items():
+        return fetch_page(RecurringCandidate, criteria, CANDIDATE_SORT_KEYS, {})[0]
+
+    builders = (("orm + to_dict", orm_items), ("rows", row_items))
+    encoders = [("stdlib", FastJSONProvider(app, use_orjson=False))]
+    if orjson is not None:
+        encoders.append(("orjson", FastJSONProvider(app)))
+    else:
+        print("orjson is not installed; timing the stdlib encoder only")
+
+    print(f"{args.rows:,} candidates, median of {args.repeats} runs")
+    print(f"{'items':>14} {'encoder':>8} {'build ms':>9} {'encode ms':>10} {'total ms':>9} {'KiB':>7}")
+
+    bodies = {}
+    with app.test_request_context():
+        for items_label, build in builders:
+            for encoder_label, provider in encoders:
+                build_ms, encode_ms = [], []
+
+                for _ in range(args.repeats):
+                    # Fresh session per run, as per request: no identity map carried over.
+                    db.session.remove()
+
+                    t0 = time.perf_counter()
+                    items = build()
+                    t1 = time.perf_counter()
+                    body = provider.response(items).get_data()
+                    t2 = time.perf_counter()
+
+                    build_ms.append((t1 - t0) * 1000)
+                    encode_ms.append((t2 - t1) * 1000)
+
+                bodies[items_label, encoder_label] = body
+                build_p50, encode_p50 = statistics.median(build_ms), statistics.median(encode_ms)
+                print(
+                    f"{items_label:>14} {encoder_label:>8} {build_p50:>9.1f} {encode_p50:>10.1f} "
+                    f"{build_p50 + encode_p50:>9.1f} {len(body) / 1024:>7.0f}"
+                )
+
+    # Same JSON, not necessarily the same bytes: orjson leaves non-ASCII text unescaped.
+    reference = json.loads(bodies["orm + to_dict", "stdlib"])
+    assert all(json.loads(body) == reference for body in bodies.values()), "serializations differ"
+
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {token}"}
+    samples = []
+
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        response = client.get("/api/candidates", headers=headers)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert response.status_code == 200 and response.get_json() == reference
+
+    backend = "orjson" if app.json.use_orjson else "stdlib"
+    print(f"GET /api/candidates ({backend}): p50 {statistics.median(samples):.1f} ms, bodies equivalent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Per-row cost of merchant normalization: original three-regex version vs. the cached engine.
+
+    python benchmarks/bench_normalize.py
+    python benchmarks/bench_normalize.py --rows 200000 --distinct 5000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import normalize  # noqa: E402
+
+
+def _legacy_normalize(raw: str) -> str:
+    """The original implementation, kept here as the comparison baseline."""
+    if not raw:
+        return "UNKNOWN"
+
+    text = raw.upper()
+    text = re.sub(r"[^A-Z0-9\s]", " ", text)
+    text = re.sub(r"\b\d{2,}\b", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+
+    if not text:
+        return "UNKNOWN"
+
+    return text[:160]
+
+
+def _merchant_strings(rows: int, distinct: int) -> list[str]:
+    rng = random.Random(7)
+    words = ["NETFLIX.COM", "SPOTIFY", "POS", "DEBIT", "PURCHASE", "KROGER", "SHELL OIL", "AMZN Mktp", "WWW"]
+
+    pool = [
+        f"{rng.choice(words)} {rng.choice(words)} #{rng.randint(100, 99999)} {rng.choice(['CA', 'OH', 'NY'])}"
+        for _ in range(distinct)
+    ]
+
+    return [pool[rng.randrange(distinct)] for _ in range(rows)]
+
+
+def _time(fn, values) -> float:
+    started = time.perf_counter()
+    fn(values)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=2_000)
+    args = parser.parse_args()
+
+    values = _merchant_strings(args.rows, args.distinct)
+
+    legacy = [_legacy_normalize(v) for v in values[:50_000]]
+    assert legacy == normalize.normalize_many(values[:50_000]), "normalization output changed"
+
+    results = {
+        "legacy re.sub": _time(lambda vs: [_legacy_normalize(v) for v in vs], values),
+        "engine, no memo": _time(lambda vs: [normalize._normalize(v) for v in vs], values),
+        "normalize_many": _time(normalize.normalize_many, values),
+    }
+
+    print(f"{args.rows} rows, {args.distinct} distinct merchant strings")
+    print(f"{'path':>16} {'seconds':>9} {'ns/row':>8}")
+    for name, elapsed in results.items():
+        print(f"{name:>16} {elapsed:>9.3f} {elapsed / args.rows * 1e9:>8.0f}")
+
+    print("cache:", normalize.normalize_cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Scaling curve of detect_recurring_parallel from 1 to N worker processes.
+
+The pool is warmed up before timing, matching a long-lived web worker where the pool
+already exists. Every run is checked against the in-process result.
+
+    python benchmarks/bench_parallel_detection.py
+    python benchmarks/bench_parallel_detection.py --merchants 200000 --max-workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import recurrence  # noqa: E402
+from bench_detection import make_columns  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--merchants", type=int, default=100_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--min-shard-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    columns = make_columns(args.merchants)
+    expected = recurrence.detect_recurring_batch(*columns)
+
+    print(f"{args.merchants} merchants, {len(columns[2])} charges, {os.cpu_count()} CPUs visible")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        kwargs = {"workers": workers, "min_shard_size": args.min_shard_size}
+
+        if workers > 1:
+            recurrence.detect_recurring_parallel(*columns, **kwargs)  # warm the pool
+
+        started = time.perf_counter()
+        results = recurrence.detect_recurring_parallel(*columns, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        assert results == expected, f"{workers} workers changed the result"
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.3f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
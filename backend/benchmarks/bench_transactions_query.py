@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+GET /api/transactions page latency (p50/p99) over a large per-user history.
+
+Seeds one user with --rows transactions (5M by default) in a scratch SQLite database,
+then times full requests through the test client for the first page, random deep
+pages (keyset cursors), a one-month date range, a merchant prefix and an amount range.
+
+    python benchmarks/bench_transactions_query.py
+    python benchmarks/bench_transactions_query.py --rows 500000 --requests 100
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEED_CHUNK = 100_000
+MERCHANTS = 2000
+START = date(2016, 1, 1).toordinal()
+DAYS = 3650
+
+
+def make_merchants(rng: random.Random) -> list[str]:
+    """Letter-only merchant keys (normalization strips digits, so "SHOP 12" wouldn't survive)."""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return sorted({
+        "".join(rng.choice(letters) for _ in range(6)) + " STORE"
+        for _ in range(MERCHANTS)
+    })
+
+
+def seed(db_path: str, rows: int, user_id: int, import_id: int, merchants: list[str], rng: random.Random) -> None:
+    """Bulk-load synthetic transactions straight through sqlite3 (the app isn't the thing timed here)."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    created = datetime.utcnow().isoformat(" ")
+
+    for offset in range(0, rows, SEED_CHUNK):
+        batch = []
+        for i in range(offset, min(offset + SEED_CHUNK, rows)):
+            key = rng.choice(merchants)
+            batch.append((
+                user_id,
+                import_id,
+                date.fromordinal(START + rng.randrange(DAYS)).isoformat(),
+                key,
+                key,
+                rng.randrange(100, 50_000),
+                f"{i:032x}",  # unique stand-in fingerprint
+                created,
+            ))
+
+        conn.executemany(
+            "INSERT INTO transactions "
+            "(user_id, import_id, txn_date, merchant_raw, merchant_key, amount_cents, fingerprint, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            batch
+        )
+        conn.commit()
+        print(f"\rseeded {offset + len(batch):,} rows", end="", flush=True)
+
+    print()
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-transactions-")
+    db_path = os.path.join(workdir, "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["IMPORT_QUEUE_PATH"] = os.path.join(workdir, "import_jobs.db")
+    os.environ["IMPORT_SPOOL_DIR"] = os.path.join(workdir, "import_spool")
+    os.environ.setdefault("JWT_SECRET_KEY", "bench-transactions-secret-key-0123456789")
+
+    from flask_jwt_extended import create_access_token
+
+    from app import create_app, db
+    from app.models.transaction import Transaction, TransactionImport
+    from app.models.user import User
+    from app.utils.pagination import encode_cursor
+
+    app = create_app()
+    rng = random.Random(5)
+
+    with app.app_context():
+        db.create_all()
+        user = User(email="bench@example.com", password_hash=b"x")
+        db.session.add(user)
+        db.session.flush()
+        batch = TransactionImport(user_id=user.id, filename="bench.csv")
+        db.session.add(batch)
+        db.session.commit()
+
+        user_id, import_id = user.id, batch.id
+        token = create_access_token(identity=str(user_id))
+
+    merchants = make_merchants(rng)
+
+    started = time.perf_counter()
+    seed(db_path, args.rows, user_id, import_id, merchants, rng)
+    print(f"seed + ANALYZE: {time.perf_counter() - started:.1f}s")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    client = app.test_client()
+    limit = f"limit={args.limit}"
+
+    def deep_page():
+        # Cursor positioned at a random point in the user's history.
+        txn_date = date.fromordinal(START + rng.randrange(DAYS))
+        return f"/api/transactions?{limit}&cursor={encode_cursor([txn_date, rng.randrange(args.rows)])}"
+
+    def date_range():
+        first = START + rng.randrange(DAYS - 31)
+        return (
+            f"/api/transactions?{limit}"
+            f"&from={date.fromordinal(first).isoformat()}&to={date.fromordinal(first + 30).isoformat()}"
+        )
+
+    def merchant_prefix():
+        # Three letters usually narrow 2000 merchants down to one.
+        return f"/api/transactions?{limit}&merchant={rng.choice(merchants)[:3]}"
+
+    def amount_range():
+        low = rng.randrange(1, 450)
+        return f"/api/transactions?{limit}&min_amount={low}&max_amount={low + 50}"
+
+    scenarios = [
+        ("first page", lambda: f"/api/transactions?{limit}"),
+        ("deep page", deep_page),
+        ("date range", date_range),
+        ("merchant prefix", merchant_prefix),
+        ("amount range", amount_range),
+    ]
+
+    with app.app_context():
+        count = db.session.query(Transaction.id).filter_by(user_id=user_id).count()
+
+    print(f"{count:,} transactions for one user, page size {args.limit}, {args.requests} requests each")
+    print(f"{'scenario':>16} {'p50 ms':>9} {'p99 ms':>9} {'rows/page':>10}")
+
+    for name, make_url in scenarios:
+        client.get(make_url(), headers=headers)  # warm the page cache for this access path
+
+        samples = []
+        rows = 0
+        for _ in range(args.requests):
+            url = make_url()
+            t0 = time.perf_counter()
+            response = client.get(url, headers=headers)
+            samples.append((time.perf_counter() - t0) * 1000)
+
+            assert response.status_code == 200, response.get_json()
+            rows += len(response.get_json())
+
+        print(
+            f"{name:>16} {statistics.median(samples):>9.2f} {percentile(samples, 99):>9.2f} "
+            f"{rows / args.requests:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+EXPLAIN QUERY PLAN check for the per-user read paths.
+
+Builds a throwaway SQLite database through the Alembic migrations, drives the list,
+dashboard, transaction history and import endpoints with the test client, and re-runs
+every SELECT they issued under EXPLAIN QUERY PLAN. Exits non-zero if any of them scans
+a table or sorts through a temp B-tree, so a dropped or mismatched index shows up here.
+
+    python benchmarks/check_query_plans.py
+    python benchmarks/check_query_plans.py --verbose
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Plan fragments that mean the index didn't cover the access path
+BAD_PLAN_MARKERS = ("SCAN ", "USE TEMP B-TREE")
+
+# Statements allowed to sort through a temp B-tree (never to scan). A merchant prefix
+# spans several keys of ix_transactions_user_merchant_date, so its matches, and only
+# those, are re-sorted by date.
+ALLOWED_SORTS = ("transactions.merchant_key >= ?",)
+
+SAMPLE_CSV = "\n".join(
+    ["Date,Description,Amount"]
+    + [f"2025-{m:02d}-05,NETFLIX.COM 12345,-15.99" for m in range(1, 13)]
+    + [f"2025-{m:02d}-11,SPOTIFY USA,-9.99" for m in range(1, 13)]
+    + [f"2025-{m:02d}-{d:02d},CORNER SHOP,-{d}.25" for m in range(1, 13) for d in (3, 17)]
+)
+
+
+def configure_environment(workdir: str) -> None:
+    """Point the app at a scratch database/queue before it is created."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'plans.db')}"
+    os.environ["IMPORT_QUEUE_PATH"] = os.path.join(workdir, "import_jobs.db")
+    os.environ["IMPORT_SPOOL_DIR"] = os.path.join(workdir, "import_spool")
+    os.environ.setdefault("JWT_SECRET_KEY", "query-plan-check-secret-key-0123456789")
+
+
+def exercise_endpoints(client, headers) -> None:
+    """Hit the read paths the composite indexes are meant to serve."""
+    subs = client.get("/api/subscriptions", headers=headers).get_json()
+    client.get("/api/subscriptions?status=active", headers=headers)
+    client.get("/api/candidates", headers=headers)
+    client.get("/api/candidates?status=", headers=headers)
+
+    # Keyset pages (second page carries a cursor) and column projection.
+    for path in (
+        "/api/subscriptions?limit=2&fields=id,name",
+        "/api/candidates?status=&limit=1",
+        "/api/transactions?limit=5&from=2025-02-01&to=2025-11-30",
+    ):
+        cursor = client.get(path, headers=headers).headers["X-Next-Cursor"]
+        client.get(f"{path}&cursor={cursor}", headers=headers)
+
+    # History filters: merchant prefix (key range) and amount range (integer cents).
+    client.get("/api/transactions?limit=5&merchant=netflix", headers=headers)
+    client.get("/api/transactions?limit=5&min_amount=5&max_amount=20", headers=headers)
+
+    client.get("/api/dashboard", headers=headers)
+    client.get("/api/dashboard/upcoming?days=365", headers=headers)
+    # Subscription writes refresh the dashboard summary's top-N list.
+    client.patch(f"/api/subscriptions/{subs[0]['id']}", headers=headers, json={"amount": 12.5})
+    client.post(
+        "/api/imports?mode=sync",
+        headers=headers,
+        # A different year so the rows aren't all fingerprint duplicates of the seed import.
+        data={"file": (io.BytesIO(SAMPLE_CSV.replace("2025-", "2024-").encode()), "again.csv")},
+        content_type="multipart/form-data"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="print every plan, not just failures")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="query-plans-")
+    configure_environment(workdir)
+
+    from flask_migrate import upgrade
+    from sqlalchemy import event
+
+    from app import create_app, db
+
+    app = create_app()
+    migrations_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+    with app.app_context():
+        upgrade(directory=migrations_dir)
+
+    client = app.test_client()
+    credentials = {"email": "plans@example.com", "password": "password123"}
+    client.post("/api/auth/register", json=credentials)
+    token = client.post("/api/auth/login", json=credentials).get_json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Seed enough rows that each table/index actually has something in it.
+    client.post(
+        "/api/imports?mode=sync",
+        headers=headers,
+        data={"file": (io.BytesIO(SAMPLE_CSV.encode()), "seed.csv")},
+        content_type="multipart/form-data"
+    )
+    pending = client.get("/api/candidates", headers=headers).get_json()
+    client.post(f"/api/candidates/{pending[0]['id']}/confirm", headers=headers)
+    for i, cadence in enumerate(["weekly", "monthly", "quarterly", "yearly"]):
+        client.post("/api/subscriptions", headers=headers, json={
+            "name": f"Plan check {i}",
+            "amount": 5 + i,
+            "cadence": cadence,
+            "next_due_date": "2026-01-01",
+        })
+
+    statements = []
+
+    with app.app_context():
+        engine = db.engine
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if not executemany and statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            exercise_endpoints(client, headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        failures = 0
+        seen = set()
+        raw = engine.raw_connection()
+
+        try:
+            cursor = raw.cursor()
+
+            for statement, parameters in statements:
+                if statement in seen:
+                    continue
+                seen.add(statement)
+
+                plan = [row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+                bad = [line for line in plan if line.startswith(BAD_PLAN_MARKERS)]
+                if any(fragment in statement for fragment in ALLOWED_SORTS):
+                    bad = [line for line in bad if not line.startswith("USE TEMP B-TREE")]
+
+                if bad or args.verbose:
+                    print(("FAIL " if bad else "ok   ") + " ".join(statement.split()))
+                    for line in plan:
+                        print(f"       {line}")
+
+                failures += bool(bad)
+        finally:
+            raw.close()
+
+    print(f"{len(seen)} distinct SELECTs checked, {failures} with a scan or temp B-tree sort")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+"""
+Dashboard latency during a login storm: inline bcrypt vs. the bounded hashing pool.
+
+Each mode starts the app in its own process behind a real threaded HTTP server (one
+thread per connection, like a threaded WSGI worker). Dashboard latency is sampled by
+one client first on an idle server, then while --storm client threads hammer
+POST /api/auth/login.
+
+    python benchmarks/load_login_storm.py
+    python benchmarks/load_login_storm.py --storm 32 --seconds 10 --rounds 12
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (label, BCRYPT_WORKERS); 0 hashes inline on the request thread as before
+MODES = (("inline", "0"), ("pool", "1"))
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _request(url: str, body=None, token=None) -> tuple[int, dict]:
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers=headers)
+
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, {}
+
+
+def _sample_dashboard(base: str, token: str, seconds: float) -> list[float]:
+    samples = []
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        status, _ = _request(f"{base}/api/dashboard", token=token)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert status == 200, status
+        time.sleep(0.02)
+
+    return samples
+
+
+def _serve() -> None:
+    """Child process: serve the app on a free local port and report the port on stdout."""
+    from werkzeug.serving import make_server
+
+    from app import create_app, db
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    print(server.server_port, flush=True)
+    server.serve_forever()
+
+
+def run_mode(workers: str, storm: int, seconds: float, rounds: int) -> tuple[list, list, dict]:
+    """Start a server with BCRYPT_WORKERS=workers, then sample the dashboard idle and under a login storm."""
+    workdir = tempfile.mkdtemp(prefix="login-storm-")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'storm.db')}",
+        IMPORT_QUEUE_PATH=os.path.join(workdir, "import_jobs.db"),
+        IMPORT_SPOOL_DIR=os.path.join(workdir, "import_spool"),
+        JWT_SECRET_KEY="login-storm-secret-key-0123456789abcdef",
+        BCRYPT_ROUNDS=str(rounds),
+        BCRYPT_WORKERS=workers,
+        RATE_LIMIT_ENABLED="0",  # measure the hashing pool, not the login limits
+    )
+
+    # The server gets its own process so the client threads below don't share its GIL.
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+
+    try:
+        base = f"http://127.0.0.1:{server.stdout.readline().strip()}"
+
+        credentials = {"email": "storm@example.com", "password": "password123"}
+        _request(f"{base}/api/auth/register", credentials)
+        _, body = _request(f"{base}/api/auth/login", credentials)
+        token = body["access_token"]
+
+        for i in range(20):
+            _request(f"{base}/api/subscriptions", {
+                "name": f"Plan {i}",
+                "amount": 5 + i,
+                "cadence": "monthly",
+                "next_due_date": "2026-01-01",
+            }, token=token)
+
+        idle = _sample_dashboard(base, token, seconds)
+
+        stop = threading.Event()
+        outcomes = {}
+        lock = threading.Lock()
+
+        def hammer():
+            while not stop.is_set():
+                status, _ = _request(f"{base}/api/auth/login", credentials)
+                with lock:
+                    outcomes[status] = outcomes.get(status, 0) + 1
+                if status == 503:
+                    time.sleep(0.1)  # what a well-behaved client does with Retry-After
+
+        threads = [threading.Thread(target=hammer, daemon=True) for _ in range(storm)]
+        for t in threads:
+            t.start()
+
+        time.sleep(0.5)  # let the storm build up
+        loaded = _sample_dashboard(base, token, seconds)
+
+        stop.set()
+        for t in threads:
+            t.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    return idle, loaded, outcomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--storm", type=int, default=24, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=6.0, help="sampling time per phase")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve()
+        return
+
+    print(f"{args.storm} login clients, bcrypt rounds {args.rounds}, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':>7} {'idle p50':>9} {'storm p50':>10} {'storm p99':>10}  logins (status: count)")
+
+    for label, workers in MODES:
+        idle, loaded, outcomes = run_mode(workers, args.storm, args.seconds, args.rounds)
+
+        counts = ", ".join(f"{k}: {v}" for k, v in sorted(outcomes.items()))
+        print(
+            f"{label:>7} {statistics.median(idle):>7.1f}ms "
+            f"{statistics.median(loaded):>8.1f}ms {percentile(loaded, 99):>8.1f}ms  {counts}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""transaction fingerprints
+
+Revision ID: 0ca0858a29dd
+Revises: 623aeb7ef0ed
+Create Date: 2026-10-17 01:19:43.082670
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0ca0858a29dd'
+down_revision = '623aeb7ef0ed'
+branch_labels = None
+depends_on = None
+
+
+# Snapshot of the columns the backfill needs (migrations must not import app models).
+transactions = sa.table(
+    'transactions',
+    sa.column('id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('txn_date', sa.Date()),
+    sa.column('merchant_raw', sa.String()),
+    sa.column('amount', sa.Numeric(10, 2)),
+    sa.column('fingerprint', sa.String()),
+)
+
+BACKFILL_CHUNK_SIZE = 5000
+
+
+def _fingerprint(user_id, txn_date, cents, merchant_raw, occurrence):
+    # Same content hash as app.utils.importer.transaction_fingerprint at the time of writing.
+    merchant = " ".join(merchant_raw.upper().split())
+    content = f"{user_id}|{txn_date.isoformat()}|{cents}|{merchant}|{occurrence}"
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _backfill():
+    """
+    Fingerprint existing rows; rows already duplicated get distinct occurrence numbers and are kept.
+
+    Walks the table in keyset batches over ix_transactions_user_date_id and updates each batch
+    before reading the next, so memory stays bounded by the batch size. Duplicates share a
+    (user, date), so the occurrence counter only ever holds one user's day.
+    """
+    conn = op.get_bind()
+
+    key = (transactions.c.user_id, transactions.c.txn_date, transactions.c.id)
+    select = sa.select(
+        transactions.c.id,
+        transactions.c.user_id,
+        transactions.c.txn_date,
+        transactions.c.amount,
+        transactions.c.merchant_raw,
+    ).order_by(*key).limit(BACKFILL_CHUNK_SIZE)
+
+    stmt = transactions.update().where(
+        transactions.c.id == sa.bindparam("txn_id")
+    ).values(fingerprint=sa.bindparam("fp"))
+
+    last = None
+    day = None
+    occurrences = {}
+
+    while True:
+        query = select if last is None else select.where(sa.tuple_(*key) > sa.tuple_(*last))
+        rows = conn.execute(query).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for txn_id, user_id, txn_date, amount, merchant_raw in rows:
+            if (user_id, txn_date) != day:
+                day = (user_id, txn_date)
+                occurrences = {}
+
+            # Within a day rows come in id order, as when the whole table was numbered by id.
+            cents = round(float(amount) * 100)
+            identity = (cents, " ".join(merchant_raw.upper().split()))
+            occurrence = occurrences.get(identity, 0)
+            occurrences[identity] = occurrence + 1
+
+            updates.append({
+                "txn_id": txn_id,
+                "fp": _fingerprint(user_id, txn_date, cents, merchant_raw, occurrence),
+            })
+
+        conn.execute(stmt, updates)
+
+        txn_id, user_id, txn_date = rows[-1][:3]
+        last = (user_id, txn_date, txn_id)
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('fingerprint', sa.String(length=32), nullable=True))
+
+    _backfill()
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('fingerprint', existing_type=sa.String(length=32), nullable=False)
+        batch_op.create_unique_constraint('uq_transactions_user_fingerprint', ['user_id', 'fingerprint'])
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_transactions_user_fingerprint', type_='unique')
+        batch_op.drop_column('fingerprint')
+
+    # ### end Alembic commands ###
@@ -0,0 +1,39 @@
+"""transaction amount cents
+
+Revision ID: 1b5d8b5888a4
+Revises: 0ca0858a29dd
+Create Date: 2026-10-17 01:27:28.802861
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b5d8b5888a4'
+down_revision = '0ca0858a29dd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount_cents', sa.BigInteger(), nullable=True))
+
+    # Numeric(10, 2) holds whole cents already, so scaling and rounding is exact.
+    op.execute("UPDATE transactions SET amount_cents = CAST(ROUND(amount * 100) AS BIGINT)")
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('amount_cents', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('amount')
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount', sa.NUMERIC(precision=10, scale=2), nullable=True))
+
+    op.execute("UPDATE transactions SET amount = amount_cents / 100.0")
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('amount', existing_type=sa.NUMERIC(precision=10, scale=2), nullable=False)
+        batch_op.drop_column('amount_cents')
@@ -0,0 +1,38 @@
+"""user summary total cents
+
+Revision ID: 5e2c71d0a9b3
+Revises: 1b5d8b5888a4
+Create Date: 2026-10-17 02:10:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2c71d0a9b3'
+down_revision = '1b5d8b5888a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Summaries are derived data and the old float totals may already have drifted, so they
+    # are dropped rather than converted; a3f9c4e1b7d2 recomputes them.
+    op.execute("DELETE FROM user_summaries")
+
+    with op.batch_alter_table('user_summaries', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('monthly_total_cents', sa.BigInteger(), nullable=False))
+        batch_op.add_column(sa.Column('annual_total_cents', sa.BigInteger(), nullable=False))
+        batch_op.drop_column('monthly_total')
+        batch_op.drop_column('annual_total')
+
+
+def downgrade():
+    op.execute("DELETE FROM user_summaries")
+
+    with op.batch_alter_table('user_summaries', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('monthly_total', sa.Float(), nullable=False))
+        batch_op.add_column(sa.Column('annual_total', sa.Float(), nullable=False))
+        batch_op.drop_column('annual_total_cents')
+        batch_op.drop_column('monthly_total_cents')
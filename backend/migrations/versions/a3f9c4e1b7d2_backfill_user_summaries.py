@@ -0,0 +1,133 @@
+"""backfill user summaries
+
+Revision ID: a3f9c4e1b7d2
+Revises: 5e2c71d0a9b3
+Create Date: 2026-10-17 02:41:07.204518
+
+"""
+from datetime import datetime
+from itertools import groupby
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f9c4e1b7d2'
+down_revision = '5e2c71d0a9b3'
+branch_labels = None
+depends_on = None
+
+# Dashboard "top subscriptions" length (summary.TOP_SUBSCRIPTIONS when this revision was written)
+TOP_SUBSCRIPTIONS = 5
+
+# Summaries inserted per executemany during the backfill
+BACKFILL_BATCH_SIZE = 1000
+
+users = sa.table(
+    'users',
+    sa.column('id', sa.Integer),
+)
+subscriptions = sa.table(
+    'subscriptions',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('amount', sa.Numeric(10, 2)),
+    sa.column('cadence', sa.String),
+    sa.column('status', sa.String),
+)
+summaries = sa.table(
+    'user_summaries',
+    sa.column('user_id', sa.Integer),
+    sa.column('monthly_total_cents', sa.BigInteger),
+    sa.column('annual_total_cents', sa.BigInteger),
+    sa.column('active_count', sa.Integer),
+    sa.column('top_subscriptions', sa.JSON),
+    sa.column('updated_at', sa.DateTime),
+)
+
+
+def _monthly_equivalent_cents(amount, cadence):
+    # Same as app.utils.summary.monthly_equivalent_cents at the time of writing.
+    amount = float(amount)
+    factor = {"weekly": 52 / 12, "monthly": 1, "quarterly": 1 / 3, "yearly": 1 / 12}.get(cadence, 1)
+    return round(amount * factor * 100)
+
+
+def _summary_row(user_id, subs, now):
+    """A user_summaries row from the user's active subscriptions, highest amount first."""
+    monthly_cents = sum(_monthly_equivalent_cents(s.amount, s.cadence) for s in subs)
+
+    return {
+        "user_id": user_id,
+        "monthly_total_cents": monthly_cents,
+        "annual_total_cents": monthly_cents * 12,
+        "active_count": len(subs),
+        "top_subscriptions": [
+            {"id": s.id, "name": s.name, "amount": float(s.amount), "cadence": s.cadence}
+            for s in subs[:TOP_SUBSCRIPTIONS]
+        ],
+        "updated_at": now,
+    }
+
+
+def upgrade():
+    """
+    Give every user without one a summary row, so the summary is created at registration
+    and the dashboard only ever reads it. Streams active subscriptions by user and holds
+    one user's at a time; users with no active subscriptions get an empty summary.
+    """
+    bind = op.get_bind()
+    now = datetime.utcnow()
+    missing = sa.not_(users.c.id.in_(sa.select(summaries.c.user_id)))
+
+    result = bind.execution_options(stream_results=True).execute(
+        sa.select(
+            subscriptions.c.id,
+            subscriptions.c.user_id,
+            subscriptions.c.name,
+            subscriptions.c.amount,
+            subscriptions.c.cadence,
+        ).where(
+            subscriptions.c.status == "active",
+            subscriptions.c.user_id.in_(sa.select(users.c.id).where(missing)),
+        ).order_by(
+            subscriptions.c.user_id,
+            subscriptions.c.amount.desc(),
+            subscriptions.c.id.desc(),
+        )
+    )
+
+    batch = []
+
+    for user_id, subs in groupby(result, key=lambda s: s.user_id):
+        batch.append(_summary_row(user_id, list(subs), now))
+
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            bind.execute(summaries.insert(), batch)
+            batch = []
+
+    if batch:
+        bind.execute(summaries.insert(), batch)
+
+    # Everyone still missing a row has no active subscriptions.
+
+    bind.execute(
+        summaries.insert().from_select(
+            ["user_id", "monthly_total_cents", "annual_total_cents", "active_count", "top_subscriptions", "updated_at"],
+            sa.select(
+                users.c.id,
+                sa.literal(0),
+                sa.literal(0),
+                sa.literal(0),
+                sa.literal([], sa.JSON),
+                sa.literal(now, sa.DateTime),
+            ).where(missing)
+        )
+    )
+
+
+def downgrade():
+    # Rows created here are indistinguishable from ones maintained since; nothing to undo.
+    pass
@@ -8,8 +8,10 @@
 from app import create_app
 
 
-# Create the Flask application instance
-app = create_app()
+# Create the Flask application instance. Detection pool workers (DETECTION_WORKERS > 1) start
+# from a fresh interpreter and re-import this file as "__mp_main__"; they must not build an app.
+if __name__ != "__mp_main__":
+    app = create_app()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Author: Hunter
+# Date: February 5th 2026
+# Version: 0.1.0
+
+import os
+import time
+
+from app import create_app
+from app.utils.jobs import run_job
+
+
+# Seconds to wait before checking an empty queue again
+POLL_INTERVAL = float(os.getenv("IMPORT_WORKER_POLL_SECONDS", "1.0"))
+
+
+def main() -> None:
+    """Run queued CSV imports outside the web process (use with IMPORT_WORKER_MODE=external)."""
+    # This process only consumes the queue; don't start the in-process job threads too.
+    os.environ["IMPORT_WORKER_MODE"] = "external"
+
+    app = create_app()
+    runner = app.extensions["import_jobs"]
+    queue = runner.queue
+
+    app.logger.info("Import worker polling %s", queue.path)
+
+    swept_at = 0.0
+
+    while True:
+        # Fail jobs left running by a worker that died, so they don't stay "running" forever.
+        if time.monotonic() - swept_at >= app.config["IMPORT_SWEEP_SECONDS"]:
+            runner.recover()
+            swept_at = time.monotonic()
+
+        job = queue.claim()
+
+        if job is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        run_job(app, queue, job)
+
+
+if __name__ == "__main__":
+    main()
@@ -63,7 +63,7 @@ export default function Dashboard() {
                   </thead>
                   <tbody>
                     {data.upcoming_30_days.map(u => (
-                      <tr key={u.subscription_id}>
+                      <tr key={`${u.subscription_id}-${u.due_date}`}>
                         <td>{u.name}</td>
                         <td>{u.due_date}</td>
                         <td>${u.amount}</td>
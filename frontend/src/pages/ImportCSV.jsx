@@ -7,11 +7,26 @@ export default function ImportCSV() {
   const [file, setFile] = useState(null)
   const [result, setResult] = useState(null)
   const [error, setError] = useState(null)
+  const [job, setJob] = useState(null)
+
+  // Large uploads come back as a background job; poll it until it finishes.
+  async function waitForJob(jobId) {
+    while (true) {
+      const status = await apiFetch(`/api/imports/${jobId}`, { token })
+      setJob(status)
+
+      if (status.status === 'succeeded') return status.result
+      if (status.status === 'failed') throw new Error(status.error || 'Import failed.')
+
+      await new Promise((resolve) => setTimeout(resolve, 1000))
+    }
+  }
 
   async function onSubmit(e) {
     e.preventDefault()
     setError(null)
     setResult(null)
+    setJob(null)
 
     if (!file) return setError('Please choose a CSV file.')
 
@@ -26,7 +41,7 @@ export default function ImportCSV() {
         body: form,
         isForm: true
       })
-      setResult(data)
+      setResult(data.status ? await waitForJob(data.id) : data)
     } catch (err) {
       setError(err.message)
     }
@@ -61,6 +76,15 @@ export default function ImportCSV() {
           <button className="primary" type="submit">Upload & Detect</button>
         </form>
 
+        {job && !result && job.status !== 'failed' && (
+          <p>
+            <small className="muted">
+              Importing in the background: {job.rows_parsed} rows parsed, {job.rows_written} saved,
+              {' '}{job.merchants_scored} merchants scored...
+            </small>
+          </p>
+        )}
+
         {/* Display backend import summary after a successful upload */}
         {result && (
           <>
@@ -69,6 +93,7 @@ export default function ImportCSV() {
             <ul>
               <li>Rows added: <strong>{result.rows_added}</strong></li>
               <li>Rows skipped: <strong>{result.rows_skipped}</strong></li>
+              <li>Duplicates ignored: <strong>{result.rows_deduplicated}</strong></li>
               <li>Candidates created: <strong>{result.candidates_created}</strong></li>
               <li>Candidates updated: <strong>{result.candidates_updated}</strong></li>
             </ul>